@@ -11,11 +11,14 @@ Note: Google Drive for Desktopの同期機能を使用するため、
       Drive APIは不要。ローカルに保存すると自動でクラウドに同期。
 """
 
+import asyncio
+import heapq
+import io
 import os
-import sys
 import yaml
-import json
+import orjson
 import logging
+import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -28,61 +31,143 @@ from src.shorts_scorer import ShortsScorer
 from src.shorts_writer import ShortsWriter
 
 
+# Parquet出力（オプション: pyarrow導入時のみ列指向形式でも保存）
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 巨大JSONのストリーミングパース（オプション: ijson導入時のみ）
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# このサイズ以上のメタデータJSONはストリーミングパースに切り替える
+STREAM_JSON_THRESHOLD = 10 * 1024 * 1024
+
+# 統合CSVに転記するスクリーニング項目
+SCREENING_FIELDS = (
+    "total_score", "usefulness", "novelty", "impact",
+    "explainability", "one_line_summary", "reason",
+)
+
+
+def numeric_score(value) -> float:
+    """スコア値を数値に正規化（欠損・非数値は0）"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def setup_logging(config: dict) -> logging.Logger:
-    """ロギング設定"""
+    """ロギング設定（再呼び出し時はハンドラを作り直さない）"""
+    root = logging.getLogger()
+
+    # 設定済みならログファイルを開き直さず既存ハンドラを使い回す
+    # （同一プロセス内での再実行でハンドラが重複するのも防ぐ）
+    if root.handlers:
+        return logging.getLogger(__name__)
+
     log_config = config.get("logging", {})
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     logging.basicConfig(
         level=getattr(logging, log_config.get("level", "INFO")),
         format=log_config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
         handlers=[
-            logging.StreamHandler(sys.stdout),
+            # 進捗ログはstderrへ（stdoutはパイプ利用時のデータ出力用に空ける）
+            logging.StreamHandler(),
             logging.FileHandler(log_dir / "arxiv_collector.log", encoding="utf-8")
         ]
     )
     return logging.getLogger(__name__)
 
 
+# libyaml入りのPyYAMLならC実装ローダーを使用（純Python比で数倍高速）
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
 def load_config(config_path: str = "config.yaml") -> dict:
     """設定ファイル読み込み"""
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def save_json(data: any, path: Path) -> None:
-    """JSONファイル保存"""
+    """JSONファイル保存（orjson: C実装エンコーダで全文字列化を回避）
+
+    一時ファイルに書いてos.replaceで差し替える。途中でクラッシュしても
+    既存ファイルが壊れないため、再実行時の読み戻しが安全になる。
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
+    os.replace(tmp_path, path)
+
+
+def load_json(path: Path) -> any:
+    """JSONファイル読み込み（orjson: バイト列から直接デコード）"""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def iter_papers(path: Path):
+    """メタデータJSON（トップレベル配列）から論文を1件ずつyieldする
+
+    閾値未満はorjsonで一括デコード。閾値以上かつijson導入時は
+    ストリーミングパースに切り替え、生バイト列と展開済みオブジェクトを
+    同時に保持しない（一括読みはピークRSSがファイルサイズの2-3倍になる）。
+    """
+    if IJSON_AVAILABLE and path.stat().st_size >= STREAM_JSON_THRESHOLD:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item")
+    else:
+        yield from load_json(path)
 
 
 def save_csv(data: list, path: Path, columns: list = None) -> None:
     """CSVファイル保存（Excel/スプレッドシート対応）"""
-    import csv
-    
     if not data:
         return
-    
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     # カラム指定がなければ最初のレコードのキーを使用
     if columns is None:
         columns = list(data[0].keys())
-    
-    with open(path, "w", encoding="utf-8-sig", newline="") as f:  # utf-8-sig: Excel対応BOM付き
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-        writer.writeheader()
-        for row in data:
-            # リストをカンマ区切り文字列に変換
-            flat_row = {}
-            for k, v in row.items():
-                if isinstance(v, list):
-                    flat_row[k] = " / ".join(str(x) for x in v)
-                else:
-                    flat_row[k] = v
-            writer.writerow(flat_row)
+
+    df = pd.DataFrame(data, columns=columns)
+
+    # リスト列（authors/categories等）だけ「 / 」区切り文字列に一括変換する。
+    # 判定は先頭行ではなく全行走査（any）で行う: translated CSVはGemini
+    # エラー行がsummary_3lines等を欠くため、先頭行がエラーだとリスト列を
+    # 見落としてPython reprのまま出力してしまう
+    for col in columns:
+        if any(isinstance(row.get(col), list) for row in data):
+            df[col] = df[col].map(
+                lambda v: " / ".join(str(x) for x in v) if isinstance(v, list) else v
+            )
+
+    # utf-8-sig: Excel対応BOM付き
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def save_parquet(data: list, path: Path) -> None:
+    """Parquetファイル保存（列指向・後段での再読込/集計用）"""
+    if not data:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(data).to_parquet(path, index=False)
 
 
 def generate_daily_summary(
@@ -92,32 +177,34 @@ def generate_daily_summary(
 ) -> str:
     """日次サマリーMarkdown生成"""
     date_str = date.strftime("%Y-%m-%d")
-    
-    lines = [
-        f"# arXiv Daily Summary - {date_str}",
-        "",
-        f"## 統計",
-        f"- 取得論文数: {len(papers)}件",
-        f"- 翻訳論文数: {len(translated)}件",
-        "",
-        f"## Top Papers",
-        ""
-    ]
-    
+
+    # 中間リストを作らずバッファへ直接書き込む
+    buf = io.StringIO()
+    buf.write(
+        f"# arXiv Daily Summary - {date_str}\n"
+        "\n"
+        "## 統計\n"
+        f"- 取得論文数: {len(papers)}件\n"
+        f"- 翻訳論文数: {len(translated)}件\n"
+        "\n"
+        "## Top Papers\n"
+        "\n"
+    )
+
     for i, t in enumerate(translated[:10], 1):
         title_ja = t.get("title_ja", t.get("original_title", "N/A"))
         summary = t.get("summary_3lines", [])
         hook = t.get("youtube_hook", "")
-        
-        lines.append(f"### {i}. {title_ja}")
-        lines.append(f"**ID**: {t.get('paper_id')}")
+
+        buf.write(f"### {i}. {title_ja}\n")
+        buf.write(f"**ID**: {t.get('paper_id')}\n")
         if hook:
-            lines.append(f"**Hook**: {hook}")
-        if summary:
-            lines.append("\n".join(f"- {s}" for s in summary))
-        lines.append("")
-    
-    return "\n".join(lines)
+            buf.write(f"**Hook**: {hook}\n")
+        for s in summary:
+            buf.write(f"- {s}\n")
+        buf.write("\n")
+
+    return buf.getvalue()
 
 
 def main():
@@ -154,23 +241,39 @@ def main():
     categories = config.get("categories", [])
     arxiv_config = config.get("arxiv", {})
     
-    papers = get_papers_by_category(
-        categories=categories,
-        max_results=arxiv_config.get("max_results_per_query", 100),
-        request_interval=arxiv_config.get("request_interval", 3.0)
-    )
-    
-    # メタデータ保存
     metadata_dir = output_dir / output_config.get("subfolders", {}).get("metadata", "metadata")
     metadata_path = metadata_dir / f"metadata_{date_str}.json"
-    save_json(papers, metadata_path)
-    
-    # CSV出力（表形式で閲覧可能）
-    metadata_csv_path = metadata_dir / f"metadata_{date_str}.csv"
-    metadata_columns = ["id", "title", "authors", "categories", "published", "abstract", "pdf_url"]
-    save_csv(papers, metadata_csv_path, metadata_columns)
-    logger.info(f"取得論文数: {len(papers)}件（CSV出力済み）")
-    
+
+    # 同日の再実行ならarXiv再取得をスキップして保存済みメタデータを使う
+    if metadata_path.exists():
+        # 後段でpaper_map構築や複数回の走査があるためリスト化して持つ
+        papers = list(iter_papers(metadata_path))
+        logger.info(f"メタデータ再利用: {metadata_path.name} ({len(papers)}件)")
+    else:
+        papers = get_papers_by_category(
+            categories=categories,
+            max_results=arxiv_config.get("max_results_per_query", 100),
+            request_interval=arxiv_config.get("request_interval", 3.0)
+        )
+
+        # メタデータ保存
+        save_json(papers, metadata_path)
+
+        # CSV出力（表形式で閲覧可能）
+        metadata_csv_path = metadata_dir / f"metadata_{date_str}.csv"
+        metadata_columns = ["id", "title", "authors", "categories", "published", "abstract", "pdf_url"]
+        save_csv(papers, metadata_csv_path, metadata_columns)
+
+        # 列指向Parquet（後段ステージの再読込がJSONより軽い・pyarrow導入時のみ）
+        if PARQUET_AVAILABLE:
+            save_parquet(papers, metadata_dir / f"metadata_{date_str}.parquet")
+
+        logger.info(f"取得論文数: {len(papers)}件（CSV出力済み）")
+
+    # paper_id → メタデータの索引。以降の全ステージで共有する
+    # （idはarXiv APIが必ず付与する必須キーのためKeyErrorで即検知させる）
+    paper_map = {p["id"]: p for p in papers}
+
     # ====== Phase 1.5: PDF全件ダウンロード ======
     logger.info("Phase 1.5: PDF全件ダウンロード開始")
     
@@ -186,9 +289,25 @@ def main():
         return
     
     logger.info("Phase 2: AIスクリーニング開始")
-    
-    screener = Screener(gemini_api_key, config.get("gemini", {}).get("model", "gemini-2.5-flash"))
-    screening_results = screener.screen_papers(papers)
+
+    # バッチ設定: enabledなら設定された並行数、無効なら逐次（並行数1）
+    gemini_config = config.get("gemini", {})
+    batch_config = gemini_config.get("batch", {})
+    max_concurrent = (
+        batch_config.get("max_concurrent", 10)
+        if batch_config.get("enabled", True)
+        else 1
+    )
+
+    # 結果キャッシュ: 再実行時に採点済み論文のAPI呼び出しをスキップ
+    use_cache = gemini_config.get("cache", {}).get("enabled", True)
+
+    screener = Screener(
+        gemini_api_key,
+        gemini_config.get("model", "gemini-2.5-flash"),
+        use_cache=use_cache
+    )
+    screening_results = screener.screen_papers(papers, max_concurrent=max_concurrent)
     
     # スクリーニング結果保存
     screening_dir = output_dir / output_config.get("subfolders", {}).get("screening", "screening")
@@ -200,22 +319,17 @@ def main():
     screening_map = {r.get("paper_id"): r for r in screening_results}
     merged_data = []
     for paper in papers:
-        paper_id = paper.get("id")
-        screening = screening_map.get(paper_id, {})
-        merged = {
-            **paper,
-            "total_score": screening.get("total_score", ""),
-            "usefulness": screening.get("usefulness", ""),
-            "novelty": screening.get("novelty", ""),
-            "impact": screening.get("impact", ""),
-            "explainability": screening.get("explainability", ""),
-            "one_line_summary": screening.get("one_line_summary", ""),
-            "reason": screening.get("reason", "")
-        }
+        screening = screening_map.get(paper.get("id"), {})
+        # 浅いコピーに直接updateする（splat展開より辞書生成が1回少ない）
+        merged = dict(paper)
+        merged.update((k, screening.get(k, "")) for k in SCREENING_FIELDS)
         merged_data.append(merged)
     
-    # スコア順にソート
-    merged_data.sort(key=lambda x: x.get("total_score", 0) or 0, reverse=True)
+    # スコア順にソート（キーは1パスで数値化される）
+    merged_data.sort(
+        key=lambda row: numeric_score(row.get("total_score")),
+        reverse=True
+    )
     
     merged_csv_path = metadata_dir / f"papers_{date_str}.csv"
     merged_columns = ["id", "title", "authors", "categories", "published", 
@@ -234,52 +348,129 @@ def main():
     )
     logger.info(f"スクリーニング通過: {len(top_papers)}件")
     
-    # ====== Phase 3: 翻訳 ======
-    logger.info("Phase 3: 翻訳開始")
-    
-    translator = Translator(gemini_api_key, config.get("gemini", {}).get("model", "gemini-2.5-flash"))
-    translated = translator.translate_papers(top_papers)
-    
+    # ====== Phase 3+4: 翻訳 & Shorts適性スコアリング ======
+    # 両フェーズはどちらもスクリーニング通過論文にのみ依存し互いに独立な
+    # ため、1つのイベントループ上で重ね合わせて壁時計時間を短縮する
+    logger.info("Phase 3+4: 翻訳・Shorts適性スコアリング開始")
+
+    translator = Translator(
+        gemini_api_key,
+        config.get("gemini", {}).get("model", "gemini-2.5-flash"),
+        use_cache=use_cache
+    )
+    shorts_config = config.get("shorts", {})
+    shorts_scorer = ShortsScorer(
+        gemini_api_key,
+        config.get("gemini", {}).get("model", "gemini-2.5-flash"),
+        use_cache=use_cache
+    )
+
+    shorts_dir = output_dir / output_config.get("subfolders", {}).get("shorts", "shorts")
+    shorts_scores_path = shorts_dir / f"shorts_scores_{date_str}.json"
+
+    # 前回実行分の採点結果を読み戻し、未採点の論文だけAPIに回す
+    scored_ids = set()
+    previous_scores = []
+    if shorts_scores_path.exists():
+        previous_scores = load_json(shorts_scores_path)
+        scored_ids = {
+            s.get("paper_id") for s in previous_scores if "error" not in s
+        }
+        logger.info(f"Shortsスコア再利用: {len(scored_ids)}件（保存済み）")
+
+    # クラッシュした前回実行のJSONLチェックポイントからも途中結果を復元
+    shorts_ckpt_path = shorts_dir / f"shorts_scores_{date_str}.jsonl"
+    if shorts_ckpt_path.exists():
+        recovered = 0
+        for line in shorts_ckpt_path.read_bytes().splitlines():
+            if not line:
+                continue
+            score = orjson.loads(line)
+            paper_id = score.get("paper_id")
+            if "error" not in score and paper_id not in scored_ids:
+                previous_scores.append(score)
+                scored_ids.add(paper_id)
+                recovered += 1
+        if recovered:
+            logger.info(f"チェックポイント復元: {recovered}件")
+
+    unscored_papers = [p for p in top_papers if p.get("id") not in scored_ids]
+    shorts_batch_size = shorts_config.get("batch_size", 0)
+    if shorts_batch_size > 1:
+        # バッチ採点は同期パスのみ: 翻訳→採点を順に実行
+        translated = translator.translate_papers(
+            top_papers, max_concurrent=max_concurrent
+        )
+        new_scores = (
+            shorts_scorer.score_papers_batched(
+                unscored_papers, batch_size=shorts_batch_size
+            )
+            if unscored_papers else []
+        )
+    else:
+        # 翻訳と採点を同一イベントループで並行実行
+        # （max_concurrentは各ステージごとの上限として効く）
+        async def _translate_and_score():
+            return await asyncio.gather(
+                translator.translate_papers_async(
+                    top_papers, max_concurrent=max_concurrent
+                ),
+                shorts_scorer.score_papers_async(
+                    unscored_papers,
+                    max_concurrent=max_concurrent,
+                    checkpoint_path=shorts_ckpt_path
+                )
+            )
+
+        translated, new_scores = asyncio.run(_translate_and_score())
+
     # 翻訳結果保存
     translated_dir = output_dir / output_config.get("subfolders", {}).get("translated", "translated")
     translated_path = translated_dir / f"translated_{date_str}.json"
     save_json(translated, translated_path)
-    
+
     # CSV出力（表形式で閲覧可能）
     translated_csv_path = translated_dir / f"translated_{date_str}.csv"
     translated_columns = ["paper_id", "title_ja", "youtube_hook", "summary_3lines", "keywords", "original_title"]
     save_csv(translated, translated_csv_path, translated_columns)
     logger.info(f"翻訳完了: {len(translated)}件（CSV出力済み）")
-    
-    # ====== Phase 4: Shorts適性スコアリング ======
-    logger.info("Phase 4: Shorts適性スコアリング開始")
-    
-    shorts_config = config.get("shorts", {})
-    shorts_scorer = ShortsScorer(gemini_api_key, config.get("gemini", {}).get("model", "gemini-2.5-flash"))
-    shorts_scores = shorts_scorer.score_papers(top_papers)
-    
-    # Shortsスコア保存
-    shorts_dir = output_dir / output_config.get("subfolders", {}).get("shorts", "shorts")
-    shorts_scores_path = shorts_dir / f"shorts_scores_{date_str}.json"
+
+    # エラーだった論文は再採点されるため、旧エラーエントリは捨てて差し替える
+    shorts_scores = [s for s in previous_scores if "error" not in s] + new_scores
+
+    # Shortsスコア保存（tmp経由のatomic書き込み）
     save_json(shorts_scores, shorts_scores_path)
+    # 最終JSONが確定したのでチェックポイントは破棄
+    shorts_ckpt_path.unlink(missing_ok=True)
     
-    # 動画化候補を抽出
-    shorts_candidates = shorts_scorer.filter_by_verdict(shorts_scores, include_mid=True)
+    # 動画化候補を抽出（上位N件の切り出しはheapq.nlargestで行うためソート不要）
+    shorts_candidates = shorts_scorer.filter_by_verdict(
+        shorts_scores, include_mid=True
+    )
     logger.info(f"Shorts候補: {len(shorts_candidates)}件 (ADOPT_HIGH + ADOPT_MID)")
     
     # ====== Phase 5: Shorts台本生成 ======
     scripts = []
     if shorts_candidates:
         max_scripts = shorts_config.get("max_scripts", 10)
-        target_papers_for_scripts = shorts_candidates[:max_scripts]
+        # 全体ソート+スライスではなく部分ヒープで上位K件のみ抽出
+        # （O(N log N)→O(N log K)・ソート済みコピーも作らない）
+        target_papers_for_scripts = heapq.nlargest(
+            max_scripts,
+            shorts_candidates,
+            key=lambda s: s.get("total_score", 0)
+        )
         
-        # paper_idで元の論文情報を取得
-        paper_map = {p.get("id"): p for p in top_papers}
+        # paper_idで元の論文情報を取得（Phase 1で構築済みの索引を再利用）
         papers_for_scripts = [paper_map.get(s.get("paper_id"), {}) for s in target_papers_for_scripts]
         
         logger.info(f"Phase 5: Shorts台本生成開始 ({len(papers_for_scripts)}件)")
         
-        shorts_writer = ShortsWriter(gemini_api_key, config.get("gemini", {}).get("model", "gemini-2.5-flash"))
+        shorts_writer = ShortsWriter(
+            gemini_api_key,
+            config.get("gemini", {}).get("model", "gemini-2.5-flash"),
+            use_cache=use_cache
+        )
         scripts = shorts_writer.generate_scripts(papers_for_scripts, target_papers_for_scripts)
         
         # 台本保存
@@ -9,78 +9,149 @@ Features:
 """
 
 import arxiv
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any
-import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 1ページあたりの取得件数（arXiv APIの上限に近い値でページング回数を削減）
+PAGE_SIZE = 100
+
+
+class _ThreadSafeClient(arxiv.Client):
+    """リクエスト間隔を全スレッドで直列に守るarxiv.Client
+
+    素のClientのスロットリングは_last_request_dtのcheck-then-sleepで
+    同期されておらず、複数スレッドから叩くと間隔判定が競合して
+    同時リクエストが漏れる。1ページ分のフィード取得全体をロックで
+    直列化し、間隔の判定・待機・更新をアトミックにする。
+    （リトライで_parse_feedが再帰するためRLockを使う）
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._request_lock = threading.RLock()
+
+    def _parse_feed(self, url, *args, **kwargs):
+        with self._request_lock:
+            return super()._parse_feed(url, *args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_client(request_interval: float) -> arxiv.Client:
+    """
+    arxiv.Clientを取得（遅延間隔ごとに1インスタンスを再利用）
+
+    Clientはセッションとレート制限状態を持つため、呼び出しごとに
+    作り直すと接続とスロットリングの履歴が毎回リセットされる。
+
+    Args:
+        request_interval: リクエスト間隔（秒）
+
+    Returns:
+        共有のarxiv.Client（スレッド間で間隔遵守を直列化済み）
+    """
+    return _ThreadSafeClient(
+        page_size=PAGE_SIZE,
+        delay_seconds=request_interval
+    )
+
+
+def _fetch_category(
+    client: arxiv.Client,
+    category: str,
+    max_results: int
+) -> List[Dict[str, Any]]:
+    """
+    単一カテゴリの論文を取得（ワーカースレッド用）
+
+    Args:
+        client: 共有の_ThreadSafeClient（リクエスト間隔をロックで直列化）
+        category: arXivカテゴリ (e.g., 'cs.AI')
+        max_results: 最大取得件数
+
+    Returns:
+        論文メタデータのリスト（重複排除前）
+    """
+    logger.info(f"Fetching papers from category: {category}")
+    papers: List[Dict[str, Any]] = []
+
+    try:
+        search = arxiv.Search(
+            query=f"cat:{category}",
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending
+        )
+
+        for result in client.results(search):
+            papers.append({
+                "id": result.entry_id.split("/")[-1],
+                "title": result.title,
+                "abstract": result.summary,
+                "authors": [author.name for author in result.authors],
+                "categories": result.categories,
+                "primary_category": result.primary_category,
+                "published": result.published.isoformat(),
+                "updated": result.updated.isoformat(),
+                "pdf_url": result.pdf_url,
+                "entry_id": result.entry_id,
+            })
+
+        logger.info(f"Fetched {len(papers)} papers from {category}")
+
+    except Exception as e:
+        logger.error(f"Error fetching papers from {category}: {e}")
+
+    return papers
+
 
 def get_papers_by_category(
     categories: List[str],
     max_results: int = 100,
-    request_interval: float = 3.0
+    request_interval: float = 3.0,
+    max_workers: int = 4
 ) -> List[Dict[str, Any]]:
     """
-    指定カテゴリから論文を取得
-    
+    指定カテゴリから論文を取得（カテゴリ並列）
+
+    HTTPリクエストは_ThreadSafeClientのロックでdelay_seconds間隔の
+    直列実行に制限されるため、並列化してもarXivへの毎秒リクエスト数は
+    増えない。速くなるのはフィード解析・結果変換が他カテゴリの
+    間隔待ちと重なる分のみ。
+
     Args:
         categories: arXivカテゴリのリスト (e.g., ['cs.AI', 'cs.LG'])
         max_results: カテゴリあたりの最大取得件数
         request_interval: リクエスト間隔（秒）
-    
+        max_workers: 並列取得するカテゴリ数
+
     Returns:
-        論文メタデータのリスト
+        論文メタデータのリスト（重複排除済み）
     """
+    client = _get_client(request_interval)
+
     all_papers: List[Dict[str, Any]] = []
     seen_ids: set = set()
-    
-    for category in categories:
-        logger.info(f"Fetching papers from category: {category}")
-        
-        try:
-            # arXiv APIクエリ構築
-            search = arxiv.Search(
-                query=f"cat:{category}",
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
-            
-            client = arxiv.Client()
-            results = client.results(search)
-            
-            for result in results:
-                paper_id = result.entry_id.split("/")[-1]
-                
-                # 重複排除
-                if paper_id in seen_ids:
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        category_results = executor.map(
+            lambda cat: _fetch_category(client, cat, max_results),
+            categories
+        )
+
+        # 重複排除はメインスレッドで実施（カテゴリ間の重複あり）
+        for papers in category_results:
+            for paper in papers:
+                if paper["id"] in seen_ids:
                     continue
-                seen_ids.add(paper_id)
-                
-                paper = {
-                    "id": paper_id,
-                    "title": result.title,
-                    "abstract": result.summary,
-                    "authors": [author.name for author in result.authors],
-                    "categories": result.categories,
-                    "primary_category": result.primary_category,
-                    "published": result.published.isoformat(),
-                    "updated": result.updated.isoformat(),
-                    "pdf_url": result.pdf_url,
-                    "entry_id": result.entry_id,
-                }
+                seen_ids.add(paper["id"])
                 all_papers.append(paper)
-            
-            logger.info(f"Fetched {len(all_papers)} papers from {category}")
-            
-        except Exception as e:
-            logger.error(f"Error fetching papers from {category}: {e}")
-        
-        # arXiv APIの推奨間隔を遵守
-        time.sleep(request_interval)
-    
+
     logger.info(f"Total unique papers fetched: {len(all_papers)}")
     return all_papers
 
@@ -101,13 +172,14 @@ def filter_by_date(
     """
     if target_date is None:
         target_date = datetime.now() - timedelta(days=1)
-    
+
     target_date_str = target_date.strftime("%Y-%m-%d")
-    
+
+    # ISO形式の先頭10文字が日付: スライス比較でプレフィックス走査を省く
     filtered = [
         paper for paper in papers
-        if paper["published"].startswith(target_date_str)
-        or paper["updated"].startswith(target_date_str)
+        if paper["published"][:10] == target_date_str
+        or paper["updated"][:10] == target_date_str
     ]
     
     logger.info(f"Filtered to {len(filtered)} papers for date {target_date_str}")
@@ -11,13 +11,19 @@ Features:
 """
 
 import csv
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 文末から除去する句読点（rstripはこの文字集合を1回走査するだけ）
+TRAILING_PUNCTUATION = "。、.!?！？"
+
+# 読み上げ順の4項目
+SCRIPT_KEYS = ("hook", "line1", "line2", "ending")
+
 
 class AudioScriptGenerator:
     """音声ナレーション台本生成"""
@@ -35,22 +41,12 @@ class AudioScriptGenerator:
         Returns:
             音声台本データ
         """
-        # 4項目を取得
-        hook = canva_text.get("hook", "").strip()
-        line1 = canva_text.get("line1", "").strip()
-        line2 = canva_text.get("line2", "").strip()
-        ending = canva_text.get("ending", "").strip()
-        
-        # 各文末に「。」を付加（既にあれば重複しない）
-        parts = []
-        for text in [hook, line1, line2, ending]:
-            if text:
-                # 末尾の句読点を除去して「。」を付加
-                text = text.rstrip("。、.!?！？")
-                parts.append(text + "。")
-        
-        # 1行に結合（改行なし）
-        audio_script = "".join(parts)
+        # 各文末の句読点を「。」に正規化して1行に結合（改行なし）
+        audio_script = "".join(
+            text.rstrip(TRAILING_PUNCTUATION) + "。"
+            for key in SCRIPT_KEYS
+            if (text := canva_text.get(key, "").strip())
+        )
         
         return {
             "paper_id": canva_text.get("paper_id", ""),
@@ -125,8 +121,7 @@ class AudioScriptGenerator:
         Returns:
             Canvaテキストのリスト
         """
-        with open(canva_json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(Path(canva_json_path).read_bytes())
 
 
 if __name__ == "__main__":
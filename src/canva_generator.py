@@ -7,20 +7,26 @@ Features:
 - 改行なしCSV出力
 """
 
-import google.generativeai as genai
 from typing import List, Dict, Any
-import json
+import asyncio
+import orjson
 import csv
 import logging
-import time
+import re
 from pathlib import Path
 
+from src import gemini_client
+
 logger = logging.getLogger(__name__)
 
-# Canva用テキスト生成プロンプト
-CANVA_TEXT_PROMPT = """
+# Geminiレスポンスから最初の「{」〜最後の「}」を一括抽出（コンパイル済み）
+JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Canva用テキスト生成指示（静的部分・システムインストラクション）
+# 毎リクエストで送り直さず、モデル側でプレフィックスとして再利用される
+CANVA_SYSTEM_INSTRUCTION = """
 あなたはYouTube Shorts動画のコピーライターです。
-以下の論文情報から、20秒動画用の4行テキストを生成してください。
+与えられた論文情報から、20秒動画用の4行テキストを生成してください。
 
 ## 制約（厳守）
 - 日本語のみ
@@ -28,6 +34,7 @@ CANVA_TEXT_PROMPT = """
 - 絵文字は禁止
 - 改行禁止（各項目は1行で完結）
 - 煽りすぎて事実と矛盾しないこと
+- audio_scriptは出力しないこと（4項目からPython側で決定的に生成する）
 
 ## 生成内容
 
@@ -47,19 +54,13 @@ CANVA_TEXT_PROMPT = """
 - 不安・余韻・断定（CTA禁止）
 - 例: 「もう戻れない」「止まらない」
 
-## 論文情報
-タイトル: {title}
-アブストラクト: {abstract}
-煽りタイトル案: {best_title}
-Shortsスコア: {shorts_score}
-
 ## 出力形式（JSON）
-{{
+{
     "hook": "<12〜14文字>",
     "line1": "<18〜22文字>",
     "line2": "<25〜30文字>",
     "ending": "<8〜10文字>"
-}}
+}
 """
 
 
@@ -72,10 +73,55 @@ class CanvaGenerator:
             api_key: Gemini APIキー
             model: 使用モデル名
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        gemini_client.configure(api_key)
+        # 静的な指示はsystem_instructionに寄せ、リクエスト本文は論文情報のみ
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.model = gemini_client.get_model(
+            model, system_instruction=CANVA_SYSTEM_INSTRUCTION
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
-    
+
+    def _build_prompt(
+        self,
+        paper: Dict[str, Any],
+        shorts_score: Dict[str, Any]
+    ) -> str:
+        """Canva用テキスト生成プロンプトを構築（動的部分のみ・f-string直組み）"""
+        clickbait = shorts_score.get("clickbait_potential", {})
+        best_title = clickbait.get("best_title", "") if isinstance(clickbait, dict) else ""
+
+        return (
+            "## 論文情報\n"
+            f"タイトル: {paper.get('title', '')}\n"
+            "アブストラクト: "
+            # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+            f"{gemini_client.truncate_to_tokens(paper.get('abstract', ''), max_tokens=375)}\n"
+            f"煽りタイトル案: {best_title}\n"
+            f"Shortsスコア: {shorts_score.get('total_score', 0)}\n"
+        )
+
+    def _parse_response(
+        self,
+        result_text: str,
+        paper: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Geminiレスポンスから4項目テキストを抽出"""
+        # JSON部分を抽出
+        match = JSON_BLOCK_RE.search(result_text)
+        if match:
+            result = orjson.loads(match.group())
+
+            # 改行を除去（安全策）
+            for key in ["hook", "line1", "line2", "ending"]:
+                if key in result:
+                    result[key] = result[key].replace("\n", "").replace("\r", "")
+
+            result["paper_id"] = paper.get("id")
+            return result
+        else:
+            self.logger.warning(f"Invalid response format for: {paper.get('id')}")
+            return {"paper_id": paper.get("id"), "error": "Invalid format"}
+
     def generate_text(
         self,
         paper: Dict[str, Any],
@@ -83,83 +129,119 @@ class CanvaGenerator:
     ) -> Dict[str, Any]:
         """
         単一論文からCanva用テキスト生成
-        
+
         Args:
             paper: 論文メタデータ
             shorts_score: Shortsスコアリング結果
-        
+
         Returns:
             4項目テキスト
         """
-        clickbait = shorts_score.get("clickbait_potential", {})
-        best_title = clickbait.get("best_title", "") if isinstance(clickbait, dict) else ""
-        
-        prompt = CANVA_TEXT_PROMPT.format(
-            title=paper.get("title", ""),
-            abstract=paper.get("abstract", "")[:1500],
-            best_title=best_title,
-            shorts_score=shorts_score.get("total_score", 0)
-        )
-        
+        prompt = self._build_prompt(paper, shorts_score)
+
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text
-            
-            # JSON部分を抽出
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                
-                # 改行を除去（安全策）
-                for key in ["hook", "line1", "line2", "ending"]:
-                    if key in result:
-                        result[key] = result[key].replace("\n", "").replace("\r", "")
-                
-                result["paper_id"] = paper.get("id")
-                return result
-            else:
-                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
-                return {"paper_id": paper.get("id"), "error": "Invalid format"}
-                
+            response = gemini_client.generate_with_retry(
+                self.model, prompt, usage_tag="canva"
+            )
+            return self._parse_response(response.text, paper)
         except Exception as e:
             self.logger.error(f"Canva text generation error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e)}
-    
-    def generate_texts(
+
+    async def generate_text_async(
+        self,
+        paper: Dict[str, Any],
+        shorts_score: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        delay_seconds: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        単一論文からCanva用テキスト生成（非同期版）
+
+        Args:
+            paper: 論文メタデータ
+            shorts_score: Shortsスコアリング結果
+            semaphore: 同時リクエスト数を制限するセマフォ
+            delay_seconds: レート制限用の待機秒数
+
+        Returns:
+            4項目テキスト
+        """
+        prompt = self._build_prompt(paper, shorts_score)
+
+        async with semaphore:
+            try:
+                response = await gemini_client.generate_with_retry_async(
+                    self.model, prompt, usage_tag="canva"
+                )
+                result = self._parse_response(response.text, paper)
+            except Exception as e:
+                self.logger.error(f"Canva text generation error for {paper.get('id')}: {e}")
+                result = {"paper_id": paper.get("id"), "error": str(e)}
+
+            # セマフォ保持中に待機してQPSを平滑化
+            await asyncio.sleep(delay_seconds)
+
+        return result
+
+    async def generate_texts_async(
         self,
         papers: List[Dict[str, Any]],
         shorts_scores: List[Dict[str, Any]],
+        max_concurrent: int = 8,
         delay_seconds: float = 0.5
     ) -> List[Dict[str, Any]]:
         """
-        複数論文からCanva用テキスト生成
-        
+        複数論文からCanva用テキスト生成（並行実行）
+
         Args:
             papers: 論文メタデータのリスト
             shorts_scores: Shortsスコアリング結果のリスト
-            delay_seconds: リクエスト間の待機秒数
-        
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
         Returns:
-            テキストデータのリスト
+            テキストデータのリスト（papersと同順）
         """
         # paper_id -> shorts_scoreマッピング
         score_map = {s.get("paper_id"): s for s in shorts_scores}
-        
-        results = []
-        
-        for i, paper in enumerate(papers):
-            paper_id = paper.get("id")
-            shorts_score = score_map.get(paper_id, {})
-            
-            self.logger.info(f"Canva text {i+1}/{len(papers)}: {paper_id}")
-            result = self.generate_text(paper, shorts_score)
-            results.append(result)
-            
-            if i < len(papers) - 1:
-                time.sleep(delay_seconds)
-        
-        return results
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.logger.info(f"Canva text generation: {len(papers)}件 (並行数{max_concurrent})")
+
+        tasks = [
+            self.generate_text_async(
+                paper, score_map.get(paper.get("id"), {}),
+                semaphore, delay_seconds
+            )
+            for paper in papers
+        ]
+        return list(await asyncio.gather(*tasks))
+
+    def generate_texts(
+        self,
+        papers: List[Dict[str, Any]],
+        shorts_scores: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        delay_seconds: float = 0.5
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文からCanva用テキスト生成（同期ラッパー）
+
+        Args:
+            papers: 論文メタデータのリスト
+            shorts_scores: Shortsスコアリング結果のリスト
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
+        Returns:
+            テキストデータのリスト
+        """
+        return asyncio.run(
+            self.generate_texts_async(
+                papers, shorts_scores, max_concurrent, delay_seconds
+            )
+        )
     
     def save_csv(
         self,
@@ -221,4 +303,4 @@ if __name__ == "__main__":
     }
     
     result = generator.generate_text(test_paper, test_score)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
@@ -9,18 +9,28 @@ Features:
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
+import io
 import logging
-import json
+import threading
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Drive API スコープ
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
+# このサイズ以下はレジューム不要（1リクエストで送り切る方が往復が少ない）
+RESUMABLE_THRESHOLD = 8 * 1024 * 1024
+
+# レジューム可能アップロード時のチャンクサイズ
+# デフォルトの小チャンクだとチャンクごとにHTTP往復が発生する
+UPLOAD_CHUNKSIZE = 16 * 1024 * 1024
+
 
 class DriveUploader:
     """Google Drive アップローダー"""
@@ -37,8 +47,48 @@ class DriveUploader:
         self.service = build("drive", "v3", credentials=self.credentials)
         self.root_folder_id = root_folder_id
         self.folder_cache: Dict[str, str] = {}
+        self._primed_parents: set = set()
         self.logger = logging.getLogger(self.__class__.__name__)
-    
+
+    def _prime_folder_cache(self, parent_id: str) -> None:
+        """
+        親フォルダ直下の全サブフォルダを1クエリで取得してキャッシュ
+
+        フォルダごとに存在確認クエリを発行する代わりに、
+        親単位で一括取得してN回のlistを1回に集約する。
+
+        Args:
+            parent_id: 親フォルダID
+        """
+        if parent_id in self._primed_parents:
+            return
+
+        query = (
+            f"'{parent_id}' in parents and "
+            f"mimeType = 'application/vnd.google-apps.folder' and "
+            f"trashed = false"
+        )
+
+        page_token = None
+        while True:
+            results = self.service.files().list(
+                q=query,
+                fields="nextPageToken, files(id, name)",
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+
+            for folder in results.get("files", []):
+                self.folder_cache.setdefault(
+                    f"{parent_id}/{folder['name']}", folder["id"]
+                )
+
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+
+        self._primed_parents.add(parent_id)
+
     def get_or_create_folder(
         self,
         folder_name: str,
@@ -56,28 +106,15 @@ class DriveUploader:
         """
         parent_id = parent_id or self.root_folder_id
         cache_key = f"{parent_id}/{folder_name}"
-        
-        # キャッシュ確認
+
+        # キャッシュ確認（初回アクセス時は親単位で一括取得）
         if cache_key in self.folder_cache:
             return self.folder_cache[cache_key]
-        
-        # 既存フォルダを検索
-        query = (
-            f"name = '{folder_name}' and "
-            f"'{parent_id}' in parents and "
-            f"mimeType = 'application/vnd.google-apps.folder' and "
-            f"trashed = false"
-        )
-        results = self.service.files().list(
-            q=query, fields="files(id, name)"
-        ).execute()
-        
-        files = results.get("files", [])
-        if files:
-            folder_id = files[0]["id"]
-            self.folder_cache[cache_key] = folder_id
-            return folder_id
-        
+
+        self._prime_folder_cache(parent_id)
+        if cache_key in self.folder_cache:
+            return self.folder_cache[cache_key]
+
         # 新規作成
         metadata = {
             "name": folder_name,
@@ -112,19 +149,22 @@ class DriveUploader:
         self,
         file_path: Path,
         folder_id: str,
-        mime_type: Optional[str] = None
+        mime_type: Optional[str] = None,
+        service: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
         ファイルをアップロード
-        
+
         Args:
             file_path: ローカルファイルパス
             folder_id: アップロード先フォルダID
             mime_type: MIMEタイプ（自動検出も可能）
-        
+            service: 使用するDriveサービス（並列アップロード用・省略時は共有）
+
         Returns:
             {"id": file_id, "name": file_name, "webViewLink": url}
         """
+        service = service or self.service
         file_path = Path(file_path)
         
         # MIMEタイプの自動判定
@@ -142,48 +182,73 @@ class DriveUploader:
             "name": file_path.name,
             "parents": [folder_id]
         }
-        
+
+        # 小さいファイルは単発アップロード、大きいファイルのみ分割再開可能に
+        resumable = file_path.stat().st_size > RESUMABLE_THRESHOLD
         media = MediaFileUpload(
-            str(file_path), mimetype=mime_type, resumable=True
+            str(file_path),
+            mimetype=mime_type,
+            resumable=resumable,
+            chunksize=UPLOAD_CHUNKSIZE if resumable else -1
         )
         
-        file = self.service.files().create(
+        file = service.files().create(
             body=metadata,
             media_body=media,
             fields="id, name, webViewLink"
         ).execute()
-        
+
         self.logger.debug(f"Uploaded: {file_path.name}")
         return file
-    
+
     def upload_papers_batch(
         self,
         papers_dir: Path,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        max_workers: int = 4
     ) -> Dict[str, Any]:
         """
-        論文PDF一括アップロード
-        
+        論文PDF一括アップロード（並列）
+
         Args:
             papers_dir: PDFが格納されたディレクトリ
             date: 対象日
-        
+            max_workers: 最大同時アップロード数
+
         Returns:
             {"uploaded": count, "files": [uploaded_files]}
         """
         monthly_folder = self.get_monthly_folder(date)
         papers_folder = self.get_or_create_folder("papers", monthly_folder)
-        
-        uploaded = []
+
         papers_dir = Path(papers_dir)
-        
-        for pdf_file in papers_dir.glob("*.pdf"):
-            try:
-                result = self.upload_file(pdf_file, papers_folder)
-                uploaded.append(result)
-            except Exception as e:
-                self.logger.error(f"Upload failed: {pdf_file.name} - {e}")
-        
+        pdf_files = sorted(papers_dir.glob("*.pdf"))
+
+        # googleapiclientのhttpオブジェクトはスレッド非対応のため
+        # ワーカースレッドごとにサービスを作成（認証情報は共有）
+        local = threading.local()
+
+        def _upload_one(pdf_file: Path) -> Dict[str, Any]:
+            if not hasattr(local, "service"):
+                local.service = build(
+                    "drive", "v3", credentials=self.credentials
+                )
+            return self.upload_file(
+                pdf_file, papers_folder, service=local.service
+            )
+
+        uploaded = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_upload_one, f): f for f in pdf_files
+            }
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    uploaded.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Upload failed: {pdf_file.name} - {e}")
+
         self.logger.info(f"Uploaded {len(uploaded)} PDFs")
         return {"uploaded": len(uploaded), "files": uploaded}
     
@@ -206,29 +271,30 @@ class DriveUploader:
         Returns:
             アップロード結果
         """
-        import tempfile
-        
         monthly_folder = self.get_monthly_folder(date)
         target_folder = self.get_or_create_folder(subfolder, monthly_folder)
-        
-        # 一時ファイルに書き出してアップロード
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            temp_path = Path(f.name)
-        
-        try:
-            # ファイル名を変更
-            final_path = temp_path.parent / filename
-            temp_path.rename(final_path)
-            
-            result = self.upload_file(final_path, target_folder, "application/json")
-            return result
-        finally:
-            # 一時ファイル削除
-            if final_path.exists():
-                final_path.unlink()
+
+        # メモリ上のバイト列をそのままアップロード（一時ファイル不要）
+        buffer = io.BytesIO(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        media = MediaIoBaseUpload(
+            buffer, mimetype="application/json", resumable=True
+        )
+
+        metadata = {
+            "name": filename,
+            "parents": [target_folder]
+        }
+
+        file = self.service.files().create(
+            body=metadata,
+            media_body=media,
+            fields="id, name, webViewLink"
+        ).execute()
+
+        self.logger.debug(f"Uploaded: {filename}")
+        return file
 
 
 if __name__ == "__main__":
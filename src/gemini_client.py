@@ -0,0 +1,219 @@
+"""
+Gemini Client - GenerativeModelインスタンスのプロセス内共有
+
+Features:
+- genai.configureの重複実行を排除
+- 同一設定のGenerativeModelを全クラスで共有（Screener/ShortsScorer等）
+- 429/5xx限定のジッター付きリトライ
+"""
+
+import google.generativeai as genai
+from google.api_core import exceptions as api_exceptions
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+import asyncio
+import logging
+import orjson
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# 実測トークン使用量の追記先（プロンプト予算チューニングの判断材料）
+USAGE_STATS_PATH = Path(".cache/usage_stats.jsonl")
+
+# 英文の1トークンあたり概算文字数。非ASCII（日本語等）は1文字≈1トークンとみなす
+ASCII_CHARS_PER_TOKEN = 4
+
+# リトライ対象はレート制限と一時的なサーバエラーのみ
+# （プロンプト不正等の4xxは待っても直らないため即時失敗させる）
+RETRYABLE_EXCEPTIONS = (
+    api_exceptions.ResourceExhausted,    # 429
+    api_exceptions.InternalServerError,  # 500
+    api_exceptions.ServiceUnavailable,   # 503
+    api_exceptions.DeadlineExceeded,     # 504
+)
+
+MAX_RETRY_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 30.0
+
+_configured_key: Optional[str] = None
+
+
+def configure(api_key: str) -> None:
+    """
+    genai.configureを必要なときだけ実行
+
+    各クラスの__init__が同じAPIキーで毎回configureし直していたため、
+    キーが変わったときのみグローバル設定を更新する。
+
+    Args:
+        api_key: Gemini APIキー
+    """
+    global _configured_key
+    if api_key != _configured_key:
+        genai.configure(api_key=api_key)
+        _configured_key = api_key
+
+
+@lru_cache(maxsize=None)
+def get_model(
+    model: str,
+    system_instruction: Optional[str] = None,
+    json_output: bool = False
+) -> genai.GenerativeModel:
+    """
+    GenerativeModelを取得（同一設定なら1インスタンスを共有）
+
+    モデル名・システムインストラクション・出力形式が一致する限り、
+    ScreenerとShortsScorerのような別クラス間でも同じインスタンスを返す。
+
+    Args:
+        model: 使用モデル名
+        system_instruction: システムインストラクション（静的プロンプト）
+        json_output: JSONモード（response_mime_type=application/json）
+
+    Returns:
+        共有のGenerativeModel
+    """
+    generation_config = (
+        genai.GenerationConfig(response_mime_type="application/json")
+        if json_output else None
+    )
+    return genai.GenerativeModel(
+        model,
+        system_instruction=system_instruction,
+        generation_config=generation_config
+    )
+
+
+def record_usage(tag: str, response) -> None:
+    """
+    レスポンスの実測トークン使用量をJSONLに追記
+
+    truncate_to_tokensの予算（600/750等）は現状固定値のため、
+    ステージ別の入出力トークンを記録しておき、実データを見て
+    予算を絞れるようにする。記録失敗はパイプラインを止めない。
+
+    Args:
+        tag: ステージ名（screening / translation / script / canva等）
+        response: generate_contentのレスポンス
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+
+    try:
+        USAGE_STATS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(USAGE_STATS_PATH, "ab") as f:
+            f.write(orjson.dumps({
+                "tag": tag,
+                "timestamp": int(time.time()),
+                "prompt_tokens": usage.prompt_token_count,
+                "output_tokens": usage.candidates_token_count,
+                "total_tokens": usage.total_token_count,
+            }) + b"\n")
+    except Exception as e:
+        logger.debug(f"Usage recording failed: {e}")
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """フルジッター付き指数バックオフの待機秒数（再試行の同期衝突を回避）"""
+    return random.uniform(0, min(2.0 ** attempt, MAX_BACKOFF_SECONDS))
+
+
+def generate_with_retry(
+    model: genai.GenerativeModel,
+    prompt: str,
+    max_attempts: int = MAX_RETRY_ATTEMPTS,
+    usage_tag: Optional[str] = None
+):
+    """
+    generate_contentを429/5xx時のみリトライして実行
+
+    固定間隔のtime.sleepによる予防的な待機ではなく、スロットリングを
+    受けたときだけ指数バックオフで引く。正常応答時は一切待たない。
+
+    Args:
+        model: 共有のGenerativeModel
+        prompt: プロンプト
+        max_attempts: 最大試行回数
+        usage_tag: 指定時はトークン使用量をステージ名付きで記録
+
+    Returns:
+        generate_contentのレスポンス
+    """
+    for attempt in range(max_attempts):
+        try:
+            response = model.generate_content(prompt)
+            if usage_tag is not None:
+                record_usage(usage_tag, response)
+            return response
+        except RETRYABLE_EXCEPTIONS as e:
+            if attempt >= max_attempts - 1:
+                raise
+            wait_time = _backoff_seconds(attempt)
+            logger.warning(
+                f"Gemini {e.__class__.__name__}, "
+                f"retrying in {wait_time:.1f}s ({attempt + 1}/{max_attempts})"
+            )
+            time.sleep(wait_time)
+
+
+async def generate_with_retry_async(
+    model: genai.GenerativeModel,
+    prompt: str,
+    max_attempts: int = MAX_RETRY_ATTEMPTS,
+    usage_tag: Optional[str] = None
+):
+    """generate_content_asyncを429/5xx時のみリトライして実行（非同期版）"""
+    for attempt in range(max_attempts):
+        try:
+            response = await model.generate_content_async(prompt)
+            if usage_tag is not None:
+                record_usage(usage_tag, response)
+            return response
+        except RETRYABLE_EXCEPTIONS as e:
+            if attempt >= max_attempts - 1:
+                raise
+            wait_time = _backoff_seconds(attempt)
+            logger.warning(
+                f"Gemini {e.__class__.__name__}, "
+                f"retrying in {wait_time:.1f}s ({attempt + 1}/{max_attempts})"
+            )
+            await asyncio.sleep(wait_time)
+
+
+def estimate_tokens(text: str) -> int:
+    """テキストの概算トークン数（ローカル計算・API呼び出しなし）"""
+    ascii_count = sum(c.isascii() for c in text)
+    return ascii_count // ASCII_CHARS_PER_TOKEN + (len(text) - ascii_count)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    概算トークン数が予算内に収まるようテキスト末尾を切り詰める
+
+    固定文字数スライス（[:2000]等）は日本語混在テキストで
+    トークン換算が大きくぶれるため、ASCII/非ASCIIを区別した
+    概算で予算に収まる最長プレフィックスを二分探索する。
+
+    Args:
+        text: 入力テキスト
+        max_tokens: トークン予算
+
+    Returns:
+        切り詰め後のテキスト
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
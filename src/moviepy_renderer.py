@@ -10,8 +10,10 @@ Features:
 
 import os
 import logging
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import ClassVar, Dict, Optional, Tuple, Union
 import tempfile
 
 from moviepy import (
@@ -23,8 +25,15 @@ from moviepy import (
     concatenate_videoclips,
 )
 from moviepy.video.fx import FadeIn, FadeOut
-from PIL import Image, ImageDraw
 import numpy as np
+from PIL import Image
+
+# OpenCVはSIMD最適化された合成演算に使う（未導入ならNumPyで代替）
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -41,65 +50,149 @@ class MoviePyRenderer:
     GRADIENT_TOP = (15, 10, 40)      # 深い紫
     GRADIENT_BOTTOM = (5, 20, 50)    # 深い青
     
+    # x264エンコードプリセット
+    # 背景+テキストの単純な映像なので"veryfast"でも画質劣化は見えない
+    # （デフォルト"medium"比でエンコード時間を大幅短縮）
+    FFMPEG_PRESET = "veryfast"
+
+    # NVIDIAハードウェアエンコーダ（NVENC）のコーデック名とプリセット
+    # NVENCはx264系プリセット名を受け付けない（p1=最速〜p7=最高画質）
+    NVENC_CODECS = ("h264_nvenc", "hevc_nvenc")
+    NVENC_PRESET = "p4"
+
     # テキスト設定（Windows日本語フォント）
     TEXT_FONT = "C:/Windows/Fonts/meiryo.ttc"  # メイリオ（日本語対応）
     TEXT_COLOR = "white"
     HOOK_FONT_SIZE = 80
     LINE_FONT_SIZE = 50      # 元に戻す
     ENDING_FONT_SIZE = 80
+
+    # (text, font_size, width, height) -> (RGBフレーム, マスク)
+    # TextClipはフォントをパスでしか受け取れず毎回フォント読込が走るため、
+    # ラスタライズ結果そのものをクラス（=プロセス）単位で共有する
+    _text_frame_cache: ClassVar[Dict[tuple, tuple]] = {}
     
     def __init__(
         self,
         output_dir: Path,
         resolution: Tuple[int, int] = (1080, 1920),
-        fps: int = 30
+        fps: int = 30,
+        codec: str = "libx264",
+        use_ffmpeg_direct: bool = False
     ):
         """
         Args:
             output_dir: 出力ディレクトリ
             resolution: 解像度 (width, height)
             fps: フレームレート
+            codec: 動画コーデック（NVIDIA GPU環境では"h264_nvenc"で
+                   ハードウェアエンコードに切り替え可能）
+            use_ffmpeg_direct: グラデーション背景でffmpeg直接経路を使うか。
+                               静止フレーム連結のためフェードインが省かれ
+                               出力の見た目が変わるので、明示オプトイン
+                               （デフォルトは従来どおりMoviePy経路）
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.width, self.height = resolution
         self.fps = fps
+        self.codec = codec
+        self.use_ffmpeg_direct = use_ffmpeg_direct
+        self._gradient_frame = None  # 同一解像度の全動画で共有
+        # 音声パス -> 長さ（秒）。バッチで同じ音声を使う場合の再プローブ防止
+        self._audio_duration_cache: Dict[str, float] = {}
+        # 背景画像パス -> リサイズ済みフレーム。バッチ内の全動画で共有し、
+        # クリップごとのデコード＋リサイズを1回にする
+        self._bg_image_cache: Dict[str, np.ndarray] = {}
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def _audio_duration(self, path: Path) -> float:
+        """
+        音声ファイルの長さ（秒）を取得
+
+        AudioFileClipは長さを知るだけでもffmpegプローブを起動するため、
+        ffprobeでdurationのみ読み取り、パス単位でキャッシュする。
+        """
+        key = str(path)
+        cached = self._audio_duration_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = subprocess.run(
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries", "format=duration",
+                    "-of", "csv=p=0",
+                    key
+                ],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            duration = float(result.stdout.strip())
+        except Exception:
+            # フォールバック: 従来どおりMoviePy経由で取得
+            with AudioFileClip(key) as clip:
+                duration = clip.duration
+
+        self._audio_duration_cache[key] = duration
+        return duration
+
+    def _gradient_array(self) -> np.ndarray:
+        """グラデーション背景フレームを取得（NumPyブロードキャストで一括計算）"""
+        # フレームは解像度にしか依存しないため、バッチ内の全動画で再利用
+        if self._gradient_frame is None:
+            # 行ごとの補間係数 (H, 1) と上下色 (3,) のブロードキャストで
+            # 1080x1920のフレームをPythonループなしに構築する
+            ratio = np.linspace(0.0, 1.0, self.height, dtype=np.float32)[:, None]
+            top = np.asarray(self.GRADIENT_TOP, dtype=np.float32)
+            bottom = np.asarray(self.GRADIENT_BOTTOM, dtype=np.float32)
+
+            column = top * (1.0 - ratio) + bottom * ratio  # (H, 3)
+            self._gradient_frame = np.broadcast_to(
+                column[:, None, :].astype(np.uint8),
+                (self.height, self.width, 3)
+            )
+
+        return self._gradient_frame
+
     def _create_gradient_background(self, duration: float) -> VideoClip:
-        """グラデーション背景を生成"""
-        def make_frame(t):
-            # 静的グラデーション
-            img = Image.new('RGB', (self.width, self.height))
-            draw = ImageDraw.Draw(img)
-            
-            for y in range(self.height):
-                ratio = y / self.height
-                r = int(self.GRADIENT_TOP[0] * (1 - ratio) + self.GRADIENT_BOTTOM[0] * ratio)
-                g = int(self.GRADIENT_TOP[1] * (1 - ratio) + self.GRADIENT_BOTTOM[1] * ratio)
-                b = int(self.GRADIENT_TOP[2] * (1 - ratio) + self.GRADIENT_BOTTOM[2] * ratio)
-                draw.line([(0, y), (self.width, y)], fill=(r, g, b))
-            
-            return np.array(img)
-        
-        # 1フレームだけ生成して使い回す（パフォーマンス向上）
-        frame = make_frame(0)
-        return ImageClip(frame, duration=duration)
+        """グラデーション背景クリップを生成"""
+        return ImageClip(self._gradient_array(), duration=duration)
+
+    def _background_array(self, img_path: str) -> np.ndarray:
+        """
+        背景画像を出力解像度のフレームとして取得（パス単位でキャッシュ）
+
+        ImageClip(path)はクリップごとにデコードし直すため、1回だけ
+        読み込んでリサイズ済みのndarrayを全動画で使い回す。
+        """
+        frame = self._bg_image_cache.get(img_path)
+        if frame is None:
+            with Image.open(img_path) as img:
+                resized = img.convert("RGB").resize((self.width, self.height))
+                frame = np.ascontiguousarray(resized)
+            self._bg_image_cache[img_path] = frame
+        return frame
     
-    def _create_text_clip(
-        self,
-        text: str,
-        font_size: int,
-        duration: float,
-        start_time: float,
-        fade_duration: float = 0.3,
-        position: str = "center"
-    ) -> TextClip:
-        """フェードイン付きテキストクリップを生成"""
+    def _render_text_frame(self, text: str, font_size: int) -> tuple:
+        """
+        テキストをRGBフレーム＋マスクに1回だけラスタライズ
+
+        フォント読み込みとグリフ描画はテキスト生成で最も重い処理なので、
+        結果のNumPy配列をクラス単位でキャッシュし、バッチ内の別インスタンス
+        を含めて同一テキストの再レンダリング（フォント再読込）を省く。
+        """
+        key = (text, font_size, self.width, self.height)
+        cached = self._text_frame_cache.get(key)
+        if cached is not None:
+            return cached
+
         # テキストエリア: 幅は画面の80%、高さは十分に取る
         text_width = int(self.width * 0.85)   # 85%の幅（左右マージン合計15%）
         text_height = int(self.height * 0.20)  # 各テキストに20%の高さを確保
-        
+
         txt_clip = TextClip(
             text=text,
             font_size=font_size,
@@ -111,15 +204,138 @@ class MoviePyRenderer:
             method="caption",
             text_align="center",
         )
-        
+
+        frame = txt_clip.get_frame(0)
+        mask = txt_clip.mask.get_frame(0) if txt_clip.mask else None
+        txt_clip.close()
+
+        cached = (frame, mask)
+        self._text_frame_cache[key] = cached
+        return cached
+
+    def _create_text_clip(
+        self,
+        text: str,
+        font_size: int,
+        duration: float,
+        start_time: float,
+        fade_duration: float = 0.3,
+        position: str = "center"
+    ) -> ImageClip:
+        """フェードイン付きテキストクリップを生成（ラスタライズ結果を再利用）"""
+        frame, mask = self._render_text_frame(text, font_size)
+
+        txt_clip = ImageClip(frame)
+        if mask is not None:
+            txt_clip = txt_clip.with_mask(ImageClip(mask, is_mask=True))
+
         # フェードインを適用
         txt_clip = txt_clip.with_effects([FadeIn(fade_duration)])
         txt_clip = txt_clip.with_duration(duration)
         txt_clip = txt_clip.with_start(start_time)
         txt_clip = txt_clip.with_position(position)
-        
+
         return txt_clip
-    
+
+    def _bake_segment(
+        self,
+        bg_frame: np.ndarray,
+        text: str,
+        font_size: int
+    ) -> np.ndarray:
+        """
+        テキストを背景に1回だけアルファ合成した静止フレームを生成
+
+        合成をフレーム毎ではなくセグメントあたり1回に落とすことで、
+        動画本体は静止画のコピーだけで構成できる。
+        """
+        frame, mask = self._render_text_frame(text, font_size)
+        baked = np.array(bg_frame, dtype=np.uint8, copy=True)
+
+        h, w = frame.shape[:2]
+        x = (self.width - w) // 2
+        y = int(self.height * 0.30)  # _create_text_clipの表示位置と同じ
+
+        roi = baked[y:y + h, x:x + w]
+        if mask is not None:
+            alpha = np.ascontiguousarray(mask, dtype=np.float32)[..., None]
+        else:
+            alpha = np.ones((h, w, 1), dtype=np.float32)
+
+        if OPENCV_AVAILABLE:
+            # cv2のSIMD演算で合成（NumPy式より中間バッファが少なく高速）
+            alpha3 = cv2.merge([alpha[..., 0]] * 3)
+            fg = cv2.multiply(frame.astype(np.float32), alpha3)
+            bg_part = cv2.multiply(roi.astype(np.float32), 1.0 - alpha3)
+            blended = cv2.add(fg, bg_part)
+        else:
+            blended = (
+                frame.astype(np.float32) * alpha
+                + roi.astype(np.float32) * (1.0 - alpha)
+            )
+        baked[y:y + h, x:x + w] = blended.astype(np.uint8)
+        return baked
+
+    def _build_segment_clip(
+        self,
+        bg_frame: np.ndarray,
+        baked_frame: np.ndarray,
+        duration: float,
+        fade_duration: float = 0.3
+    ) -> VideoClip:
+        """
+        ベイク済みフレームから1セグメント分のクリップを構築
+
+        フェードイン区間のみ背景→ベイク済みフレームを補間で生成し、
+        残りの時間は静止ImageClip（フレームコピーのみ）にする。
+        """
+        fade = min(fade_duration, duration)
+        bg32 = bg_frame.astype(np.float32)
+        delta = baked_frame.astype(np.float32) - bg32
+
+        def make_frame(t):
+            ratio = min(t / fade, 1.0) if fade > 0 else 1.0
+            return (bg32 + delta * ratio).astype(np.uint8)
+
+        fade_clip = VideoClip(make_frame, duration=fade)
+        if duration <= fade:
+            return fade_clip
+
+        static_clip = ImageClip(baked_frame, duration=duration - fade)
+        return concatenate_videoclips([fade_clip, static_clip])
+
+    def _build_baked_video(
+        self,
+        texts: Dict[str, str],
+        segment_duration: float
+    ) -> VideoClip:
+        """
+        グラデーション背景＋テキスト4区画をベイク済みフレームで構築
+
+        CompositeVideoClipの毎フレーム合成を避け、セグメント連結
+        （concatenate_videoclips）だけで全編を組み立てる。
+        """
+        bg = self._gradient_array()
+        specs = (
+            ("hook", self.HOOK_FONT_SIZE),
+            ("line1", self.LINE_FONT_SIZE),
+            ("line2", self.LINE_FONT_SIZE),
+            ("ending", self.ENDING_FONT_SIZE),
+        )
+
+        segments = []
+        for key, font_size in specs:
+            text = texts.get(key)
+            if text:
+                baked = self._bake_segment(bg, text, font_size)
+                segments.append(
+                    self._build_segment_clip(bg, baked, segment_duration)
+                )
+            else:
+                segments.append(ImageClip(bg, duration=segment_duration))
+
+        return concatenate_videoclips(segments)
+
     def render_video(
         self,
         texts: Dict[str, str],
@@ -139,154 +355,365 @@ class MoviePyRenderer:
         Returns:
             生成された動画のパス（失敗時はNone）
         """
+        # ffmpeg直接経路はフェードインを省くため明示オプトイン時のみ
+        # （失敗時は従来のMoviePy経路でレンダリングし直す）
+        if self.use_ffmpeg_direct and not background.startswith("image:"):
+            fast_path = self.render_video_ffmpeg(texts, audio_path, output_path)
+            if fast_path:
+                return fast_path
+
         try:
-            # 音声から動画長さを決定
+            # 音声から動画長さを決定（デコーダはまだ開かない）
             if audio_path and Path(audio_path).exists():
-                audio_clip = AudioFileClip(str(audio_path))
-                total_duration = audio_clip.duration + 0.5  # 余白追加
+                audio_path = Path(audio_path)
+                total_duration = self._audio_duration(audio_path) + 0.5  # 余白追加
             else:
-                audio_clip = None
+                audio_path = None
                 total_duration = 20.0  # デフォルト20秒
             
-            # 背景クリップ
-            if background.startswith("image:"):
-                img_path = background[6:]
-                bg_clip = ImageClip(img_path, duration=total_duration)
-                bg_clip = bg_clip.resized((self.width, self.height))
-            else:
-                bg_clip = self._create_gradient_background(total_duration)
-            
-            # テキストクリップ（順次表示）
-            text_clips = []
-            
             # 各テキストの表示タイミング（音声に合わせて均等配分）
             segment_duration = total_duration / 4
-            
-            # hook (0-25%)
-            if texts.get("hook"):
-                hook_clip = self._create_text_clip(
-                    texts["hook"],
-                    self.HOOK_FONT_SIZE,
-                    duration=segment_duration,  # 重複削除
-                    start_time=0,
-                    position=("center", self.height * 0.30)
-                )
-                text_clips.append(hook_clip)
-            
-            # line1 (25-50%)
-            if texts.get("line1"):
-                line1_clip = self._create_text_clip(
-                    texts["line1"],
-                    self.LINE_FONT_SIZE,
-                    duration=segment_duration,  # 重複削除
-                    start_time=segment_duration,
-                    position=("center", self.height * 0.30)
-                )
-                text_clips.append(line1_clip)
-            
-            # line2 (50-75%)
-            if texts.get("line2"):
-                line2_clip = self._create_text_clip(
-                    texts["line2"],
-                    self.LINE_FONT_SIZE,
-                    duration=segment_duration,  # 重複削除
-                    start_time=segment_duration * 2,
-                    position=("center", self.height * 0.30)
-                )
-                text_clips.append(line2_clip)
-            
-            # ending (75-100%)
-            if texts.get("ending"):
-                ending_clip = self._create_text_clip(
-                    texts["ending"],
-                    self.ENDING_FONT_SIZE,
-                    duration=segment_duration,  # 重複削除
-                    start_time=segment_duration * 3,
-                    position=("center", self.height * 0.30)
+
+            if not background.startswith("image:"):
+                # グラデーション背景はテキストを事前ベイクし、
+                # フレーム毎のアルファ合成を排除する
+                final_clip = self._build_baked_video(texts, segment_duration)
+            else:
+                final_clip = self._compose_over_image(
+                    background[6:], texts, total_duration, segment_duration
                 )
-                text_clips.append(ending_clip)
-            
-            # 合成
-            final_clip = CompositeVideoClip(
-                [bg_clip] + text_clips,
-                size=(self.width, self.height)
-            )
-            
-            # 音声を追加
+
+            # 音声を追加（実際に使う直前まで開かない）
+            audio_clip = AudioFileClip(str(audio_path)) if audio_path else None
             if audio_clip:
                 final_clip = final_clip.with_audio(audio_clip)
-            
+
             # 出力パス
             if output_path is None:
                 output_path = self.output_dir / "output.mp4"
             else:
                 output_path = Path(output_path)
-            
+
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # レンダリング
             self.logger.info(f"Rendering video: {output_path}")
+            preset = (
+                self.NVENC_PRESET if self.codec in self.NVENC_CODECS
+                else self.FFMPEG_PRESET
+            )
             final_clip.write_videofile(
                 str(output_path),
                 fps=self.fps,
-                codec="libx264",
+                codec=self.codec,
+                preset=preset,
                 audio_codec="aac",
                 logger=None  # MoviePyのログを抑制
             )
-            
+
             # クリーンアップ
             final_clip.close()
             if audio_clip:
                 audio_clip.close()
-            
+
             self.logger.info(f"Video saved: {output_path}")
             return output_path
-            
+
         except Exception as e:
             self.logger.error(f"Render error: {e}")
             return None
-    
+
+    def render_video_ffmpeg(
+        self,
+        texts: Dict[str, str],
+        audio_path: Optional[Path] = None,
+        output_path: Optional[Path] = None
+    ) -> Optional[Path]:
+        """
+        ffmpeg直接呼び出しによる高速レンダリング（グラデーション背景用）
+
+        ベイク済み静止フレーム4枚をPNGへ書き出し、concatデマルチプレクサ
+        ＋音声ミックスを1回のffmpeg実行で完結させる。MoviePyのフレーム毎
+        Pythonコールバックを完全に回避するため、コストはエンコードのみ。
+        静止フレーム連結のためフェードインはこの経路では省略され、
+        出力の見た目が変わる。そのためuse_ffmpeg_direct=Trueの
+        明示オプトイン時のみrender_videoから使われる。
+
+        Args:
+            texts: テキストデータ {hook, line1, line2, ending}
+            audio_path: 音声ファイルパス（Noneの場合は無音）
+            output_path: 出力パス（Noneの場合は自動生成）
+
+        Returns:
+            生成された動画のパス（失敗時はNone→呼び出し元がフォールバック）
+        """
+        if audio_path and Path(audio_path).exists():
+            audio_path = Path(audio_path)
+            total_duration = self._audio_duration(audio_path) + 0.5
+        else:
+            audio_path = None
+            total_duration = 20.0
+        segment_duration = total_duration / 4
+
+        if output_path is None:
+            output_path = self.output_dir / "output.mp4"
+        else:
+            output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        bg = self._gradient_array()
+        specs = (
+            ("hook", self.HOOK_FONT_SIZE),
+            ("line1", self.LINE_FONT_SIZE),
+            ("line2", self.LINE_FONT_SIZE),
+            ("ending", self.ENDING_FONT_SIZE),
+        )
+
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmp = Path(tmpdir)
+
+                lines = []
+                frame_path = None
+                for i, (key, font_size) in enumerate(specs):
+                    text = texts.get(key)
+                    frame = (
+                        self._bake_segment(bg, text, font_size)
+                        if text else np.asarray(bg)
+                    )
+                    frame_path = tmp / f"seg_{i}.png"
+                    Image.fromarray(frame).save(frame_path)
+                    lines.append(
+                        f"file '{frame_path}'\n"
+                        f"duration {segment_duration:.3f}\n"
+                    )
+
+                # concatデマルチプレクサの仕様で最終エントリを再掲して長さを確定
+                lines.append(f"file '{frame_path}'\n")
+                list_path = tmp / "frames.txt"
+                list_path.write_text("".join(lines), encoding="utf-8")
+
+                preset = (
+                    self.NVENC_PRESET if self.codec in self.NVENC_CODECS
+                    else self.FFMPEG_PRESET
+                )
+                cmd = [
+                    "ffmpeg", "-y",
+                    "-f", "concat", "-safe", "0", "-i", str(list_path),
+                ]
+                if audio_path:
+                    cmd += ["-i", str(audio_path)]
+                cmd += [
+                    "-c:v", self.codec,
+                    "-preset", preset,
+                    "-r", str(self.fps),
+                    "-pix_fmt", "yuv420p",
+                ]
+                if audio_path:
+                    # 既にAAC系コンテナならデコード・再エンコードせず
+                    # ストリームコピーでそのままMP4へ多重化する
+                    if audio_path.suffix.lower() in (".aac", ".m4a"):
+                        cmd += ["-c:a", "copy", "-shortest"]
+                    else:
+                        cmd += ["-c:a", "aac", "-shortest"]
+                cmd.append(str(output_path))
+
+                self.logger.info(f"Rendering video (ffmpeg direct): {output_path}")
+                subprocess.run(cmd, capture_output=True, check=True)
+
+            self.logger.info(f"Video saved: {output_path}")
+            return output_path
+
+        except Exception as e:
+            self.logger.warning(f"ffmpeg direct render failed, falling back: {e}")
+            return None
+
+    def _compose_over_image(
+        self,
+        img_path: str,
+        texts: Dict[str, str],
+        total_duration: float,
+        segment_duration: float
+    ) -> VideoClip:
+        """画像背景にテキストを重ねる（従来のCompositeVideoClip経路）"""
+        # デコード・リサイズ済みフレームを共有（クリップごとの再読込なし）
+        bg_clip = ImageClip(self._background_array(img_path), duration=total_duration)
+
+        # テキストクリップ（順次表示）
+        text_clips = []
+
+        # hook (0-25%)
+        if texts.get("hook"):
+            hook_clip = self._create_text_clip(
+                texts["hook"],
+                self.HOOK_FONT_SIZE,
+                duration=segment_duration,  # 重複削除
+                start_time=0,
+                position=("center", self.height * 0.30)
+            )
+            text_clips.append(hook_clip)
+
+        # line1 (25-50%)
+        if texts.get("line1"):
+            line1_clip = self._create_text_clip(
+                texts["line1"],
+                self.LINE_FONT_SIZE,
+                duration=segment_duration,  # 重複削除
+                start_time=segment_duration,
+                position=("center", self.height * 0.30)
+            )
+            text_clips.append(line1_clip)
+
+        # line2 (50-75%)
+        if texts.get("line2"):
+            line2_clip = self._create_text_clip(
+                texts["line2"],
+                self.LINE_FONT_SIZE,
+                duration=segment_duration,  # 重複削除
+                start_time=segment_duration * 2,
+                position=("center", self.height * 0.30)
+            )
+            text_clips.append(line2_clip)
+
+        # ending (75-100%)
+        if texts.get("ending"):
+            ending_clip = self._create_text_clip(
+                texts["ending"],
+                self.ENDING_FONT_SIZE,
+                duration=segment_duration,  # 重複削除
+                start_time=segment_duration * 3,
+                position=("center", self.height * 0.30)
+            )
+            text_clips.append(ending_clip)
+
+        # 合成
+        return CompositeVideoClip(
+            [bg_clip] + text_clips,
+            size=(self.width, self.height)
+        )
+
     def render_batch(
         self,
         video_data_list: list,
         audio_dir: Path,
-        output_subdir: str = "video"
+        output_subdir: str = "video",
+        max_workers: int = 1
     ) -> Dict[str, any]:
         """
         複数動画を一括レンダリング
-        
+
         Args:
             video_data_list: [{"index": 1, "texts": {...}}, ...]
             audio_dir: 音声ファイルディレクトリ
             output_subdir: 出力サブディレクトリ名
-        
+            max_workers: 並列レンダリングするプロセス数（1で逐次）
+
         Returns:
             {"success": int, "failed": int, "paths": [...]}
         """
         video_dir = self.output_dir / output_subdir
         video_dir.mkdir(parents=True, exist_ok=True)
-        
+
         results = {"success": 0, "failed": 0, "paths": []}
-        
-        for item in video_data_list:
-            idx = item.get("index", 0)
-            texts = item.get("texts", {})
-            
-            audio_path = audio_dir / f"video_{idx:02d}.mp3"
-            output_path = video_dir / f"video_{idx:02d}.mp4"
-            
-            self.logger.info(f"Rendering {idx}/{len(video_data_list)}...")
-            
-            result_path = self.render_video(
-                texts=texts,
-                audio_path=audio_path if audio_path.exists() else None,
-                output_path=output_path
-            )
-            
-            if result_path:
-                results["success"] += 1
-                results["paths"].append(str(result_path))
-            else:
-                results["failed"] += 1
-        
+
+        if max_workers <= 1:
+            # 逐次レンダリング
+            for item in video_data_list:
+                idx = item.get("index", 0)
+                self.logger.info(f"Rendering {idx}/{len(video_data_list)}...")
+                result_path = self._render_batch_item(item, audio_dir, video_dir)
+
+                if result_path:
+                    results["success"] += 1
+                    results["paths"].append(str(result_path))
+                else:
+                    results["failed"] += 1
+            return results
+
+        # レンダリングはフレーム合成＋ffmpegエンコードでCPUバウンドのため
+        # プロセス並列で動画単位にスケールさせる
+        self.logger.info(
+            f"Rendering {len(video_data_list)} videos with {max_workers} processes..."
+        )
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _render_in_subprocess,
+                    item,
+                    str(audio_dir),
+                    str(video_dir),
+                    str(self.output_dir),
+                    (self.width, self.height),
+                    self.fps,
+                    self.codec
+                ): item.get("index", 0)
+                for item in video_data_list
+            }
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    result_path = future.result()
+                except Exception as e:
+                    self.logger.error(f"Render worker error (video {idx}): {e}")
+                    result_path = None
+
+                if result_path:
+                    results["success"] += 1
+                    results["paths"].append(result_path)
+                else:
+                    results["failed"] += 1
+
+        results["paths"].sort()
         return results
+
+    def _render_batch_item(
+        self,
+        item: Dict[str, any],
+        audio_dir: Path,
+        video_dir: Path
+    ) -> Optional[Path]:
+        """バッチ内の1動画をレンダリング"""
+        idx = item.get("index", 0)
+        audio_path = audio_dir / f"video_{idx:02d}.mp3"
+        output_path = video_dir / f"video_{idx:02d}.mp4"
+
+        # 同名のAAC系ファイルがあれば優先（再エンコードせず多重化できる）
+        for suffix in (".m4a", ".aac"):
+            alt_path = audio_path.with_suffix(suffix)
+            if alt_path.exists():
+                audio_path = alt_path
+                break
+
+        return self.render_video(
+            texts=item.get("texts", {}),
+            audio_path=audio_path if audio_path.exists() else None,
+            output_path=output_path
+        )
+
+
+def _render_in_subprocess(
+    item: dict,
+    audio_dir: str,
+    video_dir: str,
+    output_dir: str,
+    resolution: Tuple[int, int],
+    fps: int,
+    codec: str
+) -> Optional[str]:
+    """
+    ワーカープロセス用エントリポイント
+
+    MoviePyのクリップはpickleできないため、レンダラーは
+    ワーカー側で構築する（spawn環境=Windowsでも動作）。
+    """
+    renderer = MoviePyRenderer(
+        output_dir=Path(output_dir),
+        resolution=resolution,
+        fps=fps,
+        codec=codec
+    )
+    result_path = renderer._render_batch_item(
+        item, Path(audio_dir), Path(video_dir)
+    )
+    return str(result_path) if result_path else None
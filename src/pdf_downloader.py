@@ -9,9 +9,11 @@ Features:
 
 import httpx
 import asyncio
+import os
+import random
 from pathlib import Path
 from typing import List, Dict, Any
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,23 +22,30 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 60.0
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 2
+MAX_BACKOFF_SECONDS = 30.0
+
+# ストリーミング書き込みのチャンクサイズ
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 async def download_pdf_async(
+    client: httpx.AsyncClient,
     paper: Dict[str, Any],
     output_dir: Path,
-    timeout: float = DEFAULT_TIMEOUT,
-    max_retries: int = MAX_RETRIES
+    max_retries: int = MAX_RETRIES,
+    existing_names: set = None
 ) -> bool:
     """
     単一のPDFを非同期でダウンロード
-    
+
     Args:
+        client: バッチ全体で共有するHTTPクライアント
         paper: 論文メタデータ
         output_dir: 保存先ディレクトリ
-        timeout: タイムアウト秒数
         max_retries: 最大リトライ回数
-    
+        existing_names: 保存先の既存ファイル名集合（バッチ呼び出し時に
+                        1回のscandirで列挙したもの。未指定なら個別にstat）
+
     Returns:
         成功時True
     """
@@ -44,33 +53,62 @@ async def download_pdf_async(
     if not pdf_url:
         logger.warning(f"No PDF URL for paper: {paper.get('id')}")
         return False
-    
+
     paper_id = paper.get("id", "unknown").replace("/", "_")
-    output_path = output_dir / f"{paper_id}.pdf"
-    
+    filename = f"{paper_id}.pdf"
+    output_path = output_dir / filename
+
     # 既にダウンロード済みならスキップ
-    if output_path.exists():
+    downloaded = (
+        filename in existing_names
+        if existing_names is not None
+        else output_path.exists()
+    )
+    if downloaded:
         logger.debug(f"Already exists: {output_path}")
         return True
-    
+
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(pdf_url)
+            # レスポンスを全量バッファせず、チャンク単位でディスクへ流す
+            async with client.stream("GET", pdf_url) as response:
                 response.raise_for_status()
-                
-                output_path.write_bytes(response.content)
-                logger.debug(f"Downloaded: {output_path}")
-                return True
-                
+                with open(output_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+
+            logger.debug(f"Downloaded: {output_path}")
+            return True
+
         except Exception as e:
-            wait_time = BACKOFF_FACTOR ** attempt
+            # 途中まで書けたファイルを残さない（次回実行のスキップ判定対策）
+            if output_path.exists():
+                output_path.unlink()
+
+            retry_after = None
+            if isinstance(e, httpx.HTTPStatusError):
+                # 存在しないPDFはリトライしても無駄
+                if e.response.status_code == 404:
+                    logger.error(f"PDF not found (404): {paper_id}")
+                    return False
+                retry_after = e.response.headers.get("Retry-After")
+
+            # フルジッタ付き指数バックオフ
+            # （スロットリング時に全コルーチンが同時刻に再送するのを防ぐ）
+            wait_time = random.uniform(0, BACKOFF_FACTOR ** attempt)
+            if retry_after:
+                try:
+                    wait_time = max(wait_time, float(retry_after))
+                except ValueError:
+                    pass
+            wait_time = min(MAX_BACKOFF_SECONDS, wait_time)
+
             logger.warning(
                 f"Retry {attempt + 1}/{max_retries} for {paper_id}: {e}. "
-                f"Waiting {wait_time}s..."
+                f"Waiting {wait_time:.1f}s..."
             )
             await asyncio.sleep(wait_time)
-    
+
     logger.error(f"Failed to download: {paper_id}")
     return False
 
@@ -92,25 +130,37 @@ async def download_papers_batch(
         {paper_id: success}の辞書
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    # 既存ファイル名を1回のscandirでまとめて取得する
+    # （ファイルごとのstatはDrive同期フォルダ等で特に高くつく）
+    with os.scandir(output_dir) as entries:
+        existing_names = {entry.name for entry in entries}
+
     semaphore = asyncio.Semaphore(max_concurrent)
     results: Dict[str, bool] = {}
-    
-    async def download_with_limit(paper: Dict[str, Any]) -> None:
+
+    async def download_with_limit(
+        client: httpx.AsyncClient, paper: Dict[str, Any]
+    ) -> None:
         async with semaphore:
             paper_id = paper.get("id", "unknown")
-            success = await download_pdf_async(paper, output_dir)
+            success = await download_pdf_async(
+                client, paper, output_dir, existing_names=existing_names
+            )
             results[paper_id] = success
-    
-    tasks = [download_with_limit(paper) for paper in papers]
-    
-    # プログレスバー付きで実行
-    for coro in tqdm(
-        asyncio.as_completed(tasks),
-        total=len(tasks),
-        desc="Downloading PDFs"
-    ):
-        await coro
+
+    # バッチ全体で1クライアントを共有（arxiv.orgへのTCP/TLS確立を償却）
+    limits = httpx.Limits(
+        max_connections=max_concurrent,
+        max_keepalive_connections=max_concurrent
+    )
+    async with httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT, limits=limits, follow_redirects=True
+    ) as client:
+        tasks = [download_with_limit(client, paper) for paper in papers]
+
+        # プログレスバー付きで一括実行
+        await tqdm_asyncio.gather(*tasks, desc="Downloading PDFs")
     
     success_count = sum(results.values())
     logger.info(f"Downloaded {success_count}/{len(papers)} PDFs")
@@ -0,0 +1,81 @@
+"""
+Result Cache - Gemini呼び出し結果の永続キャッシュ
+
+Features:
+- (paper_id, プロンプトSHA-1) キーで結果JSONをディスク保存
+- 再実行時のAPIコストをゼロに（失敗後のリトライ・閾値変更後の再集計）
+- プロンプトテンプレート変更時は自動的にキャッシュミス
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".cache")
+
+
+class ResultCache:
+    """Gemini呼び出し結果のファイルベース永続キャッシュ"""
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            namespace: キャッシュ名前空間（例: "screening", "shorts_scores"）
+            cache_dir: キャッシュルートディレクトリ
+            enabled: Falseなら常にミス扱い（保存もしない）
+        """
+        self.enabled = enabled
+        self.cache_dir = Path(cache_dir) / namespace
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def make_key(paper_id: Any, prompt: str) -> str:
+        """
+        キャッシュキーを生成
+
+        paper_idだけでなくプロンプト全体のハッシュを含めることで、
+        プロンプトテンプレート変更時に古い結果を返さない。
+        """
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+        safe_id = str(paper_id).replace("/", "_")
+        return f"{safe_id}_{digest[:16]}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """キャッシュ取得（ミス・破損時はNone）"""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            result = orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
+            # 書き込み途中で落ちた破損ファイルはミス扱いで上書きさせる
+            self.logger.warning(f"Corrupted cache entry: {path.name}")
+            return None
+
+        self.logger.debug(f"Cache hit: {key}")
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """キャッシュ保存"""
+        if not self.enabled:
+            return
+        self._path(key).write_bytes(orjson.dumps(result))
@@ -7,18 +7,22 @@ Features:
 - 上位N件の選定
 """
 
-import google.generativeai as genai
 from typing import List, Dict, Any
-import json
+from operator import itemgetter
+import asyncio
+import heapq
+import orjson
 import logging
-import time
+
+from src import gemini_client
+from src.result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
-# スクリーニング用プロンプトテンプレート
-SCREENING_PROMPT = """
+# スクリーニング指示（静的部分・システムインストラクション）
+SCREENING_SYSTEM_INSTRUCTION = """
 あなたは学術論文の評価エキスパートです。
-以下の論文のタイトルとアブストラクトを評価し、「有益度スコア」を1-10で採点してください。
+与えられた論文のタイトルとアブストラクトを評価し、「有益度スコア」を1-10で採点してください。
 
 ## 評価基準
 1. **実用性** (1-10): 実際のアプリケーションに活用できるか
@@ -26,13 +30,8 @@ SCREENING_PROMPT = """
 3. **影響度** (1-10): 分野に大きなインパクトを与えそうか
 4. **わかりやすさ** (1-10): 一般視聴者に説明可能か（YouTubeショート向け）
 
-## 論文情報
-タイトル: {title}
-カテゴリ: {categories}
-アブストラクト: {abstract}
-
 ## 出力形式（JSON）
-{{
+{
     "usefulness": <1-10>,
     "novelty": <1-10>,
     "impact": <1-10>,
@@ -40,84 +39,193 @@ SCREENING_PROMPT = """
     "total_score": <1-10の平均>,
     "one_line_summary": "<日本語で1行要約>",
     "reason": "<スコアの理由を日本語で1-2文>"
-}}
+}
 """
 
 
 class Screener:
     """論文スクリーニングクラス"""
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        use_cache: bool = True
+    ):
         """
         Args:
             api_key: Gemini APIキー
             model: 使用モデル名
+            use_cache: スクリーニング結果のディスクキャッシュを使うか
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        gemini_client.configure(api_key)
+        # 静的な指示はsystem_instructionに寄せ、リクエスト本文は論文情報のみ
+        # JSONモード指定によりレスポンス全体が必ずJSONになる
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.model = gemini_client.get_model(
+            model,
+            system_instruction=SCREENING_SYSTEM_INSTRUCTION,
+            json_output=True
+        )
+        self.cache = ResultCache("screening", enabled=use_cache)
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def _build_prompt(self, paper: Dict[str, Any]) -> str:
+        """スクリーニングプロンプトを構築（動的部分のみ・f-string直組み）"""
+        # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+        abstract = gemini_client.truncate_to_tokens(
+            paper.get("abstract", ""), max_tokens=600
+        )
+        return (
+            "## 論文情報\n"
+            f"タイトル: {paper.get('title', '')}\n"
+            f"カテゴリ: {', '.join(paper.get('categories', []))}\n"
+            f"アブストラクト: {abstract}\n"
+        )
+
+    def _parse_response(
+        self,
+        result_text: str,
+        paper: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Geminiレスポンスからスクリーニング結果を抽出"""
+        try:
+            # JSONモードのためレスポンス全体をそのままパース
+            result = orjson.loads(result_text)
+        except orjson.JSONDecodeError:
+            # フォールバック: 括弧範囲を抽出（JSONモード以前の挙動）
+            start = result_text.find("{")
+            end = result_text.rfind("}") + 1
+            if start == -1 or end <= start:
+                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
+                return {"paper_id": paper.get("id"), "error": "Invalid format"}
+            result = orjson.loads(result_text[start:end])
+
+        result["paper_id"] = paper.get("id")
+        return result
+
     def screen_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         """
         単一論文をスクリーニング
-        
+
         Args:
             paper: 論文メタデータ
-        
+
         Returns:
             スクリーニング結果
         """
-        prompt = SCREENING_PROMPT.format(
-            title=paper.get("title", ""),
-            categories=", ".join(paper.get("categories", [])),
-            abstract=paper.get("abstract", "")[:2000]  # トークン節約
-        )
-        
+        prompt = self._build_prompt(paper)
+
+        # 再実行時は同一プロンプトの結果をディスクから返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text
-            
-            # JSON部分を抽出
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                result["paper_id"] = paper.get("id")
-                return result
-            else:
-                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
-                return {"paper_id": paper.get("id"), "error": "Invalid format"}
-                
+            response = gemini_client.generate_with_retry(
+                self.model, prompt, usage_tag="screening"
+            )
+            result = self._parse_response(response.text, paper)
         except Exception as e:
             self.logger.error(f"Screening error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e)}
-    
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def screen_paper_async(
+        self,
+        paper: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        delay_seconds: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        単一論文をスクリーニング（非同期版）
+
+        Args:
+            paper: 論文メタデータ
+            semaphore: 同時リクエスト数を制限するセマフォ
+            delay_seconds: レート制限用の待機秒数
+
+        Returns:
+            スクリーニング結果
+        """
+        prompt = self._build_prompt(paper)
+
+        # キャッシュヒットならAPIにもセマフォにも触れず即座に返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            try:
+                response = await gemini_client.generate_with_retry_async(
+                    self.model, prompt, usage_tag="screening"
+                )
+                result = self._parse_response(response.text, paper)
+            except Exception as e:
+                self.logger.error(f"Screening error for {paper.get('id')}: {e}")
+                result = {"paper_id": paper.get("id"), "error": str(e)}
+
+            # セマフォ保持中に待機してQPSを平滑化
+            await asyncio.sleep(delay_seconds)
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def screen_papers_async(
+        self,
+        papers: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        delay_seconds: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文をスクリーニング（並行実行）
+
+        Args:
+            papers: 論文メタデータのリスト
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
+        Returns:
+            スクリーニング結果のリスト（papersと同順）
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.logger.info(f"Screening {len(papers)}件 (並行数{max_concurrent})")
+
+        tasks = [
+            self.screen_paper_async(paper, semaphore, delay_seconds)
+            for paper in papers
+        ]
+        return list(await asyncio.gather(*tasks))
+
     def screen_papers(
         self,
         papers: List[Dict[str, Any]],
+        max_concurrent: int = 8,
         delay_seconds: float = 1.0
     ) -> List[Dict[str, Any]]:
         """
-        複数論文をスクリーニング
-        
+        複数論文をスクリーニング（同期ラッパー）
+
         Args:
             papers: 論文メタデータのリスト
-            delay_seconds: リクエスト間の待機秒数
-        
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
         Returns:
             スクリーニング結果のリスト
         """
-        results = []
-        
-        for i, paper in enumerate(papers):
-            self.logger.info(f"Screening {i+1}/{len(papers)}: {paper.get('id')}")
-            result = self.screen_paper(paper)
-            results.append(result)
-            
-            if i < len(papers) - 1:
-                time.sleep(delay_seconds)
-        
-        return results
+        return asyncio.run(
+            self.screen_papers_async(papers, max_concurrent, delay_seconds)
+        )
     
     def select_top_papers(
         self,
@@ -141,18 +249,17 @@ class Screener:
         # paper_id -> paper のマッピング
         paper_map = {p.get("id"): p for p in papers}
         
-        # エラーなし & 閾値以上のみ
-        valid_results = [
-            r for r in screening_results
+        # エラーなし & 閾値以上のみ（スコアは1回だけ取り出してタプル化）
+        keyed = [
+            (r.get("total_score", 0), r)
+            for r in screening_results
             if "error" not in r and r.get("total_score", 0) >= min_score
         ]
-        
-        # スコア降順でソート
-        sorted_results = sorted(
-            valid_results,
-            key=lambda x: x.get("total_score", 0),
-            reverse=True
-        )[:top_n]
+
+        # 全件ソートではなく上位top_n件のみ抽出（O(N log k)）
+        sorted_results = [
+            r for _, r in heapq.nlargest(top_n, keyed, key=itemgetter(0))
+        ]
         
         # 元の論文情報と結合
         selected = []
@@ -188,4 +295,4 @@ if __name__ == "__main__":
     }
     
     result = screener.screen_paper(test_paper)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
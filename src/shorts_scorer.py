@@ -7,20 +7,23 @@ Features:
 - 3段階verdict判定（ADOPT_HIGH/ADOPT_MID/SKIP）
 """
 
-import google.generativeai as genai
 from typing import List, Dict, Any
-import json
+import asyncio
+import orjson
 import logging
 import time
 
+from src import gemini_client
+from src.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
-# Shorts適性スコアリングプロンプト
-SHORTS_SCORING_PROMPT = """
-あなたはYouTube Shortsの編集者です。
-以下の論文が「30秒Shorts」として再生されやすいか評価してください。
+# 動画化対象のverdict（frozenset: タプルの線形走査ではなくO(1)のハッシュ照合）
+ADOPT_VERDICTS = frozenset({"ADOPT_HIGH", "ADOPT_MID"})
+ADOPT_HIGH_ONLY = frozenset({"ADOPT_HIGH"})
 
-## 評価基準（100点満点）
+# 評価基準（単一・バッチ両プロンプトで共有する静的部分）
+SHORTS_SCORING_CRITERIA = """## 評価基準（100点満点）
 
 ### 1. 煽りタイトル変換可能性 (最大25点) 【最重要】
 まず、以下の形式でタイトルを3案作成してください：
@@ -63,14 +66,10 @@ SHORTS_SCORING_PROMPT = """
 ### 6. 実装の現実性 (最大10点)
 - 今すぐ使える: 10点
 - 近い将来: 5点
-- 遠い/研究段階: 0点
-
-## 論文情報
-タイトル: {title}
-アブストラクト: {abstract}
+- 遠い/研究段階: 0点"""
 
-## 出力形式（JSON）
-{{
+# 1論文分の出力スキーマ（.format用に波括弧はエスケープ済み）
+SHORTS_RESULT_SCHEMA = """{{
     "clickbait_potential": {{
         "score": <0-25>,
         "generated_titles": ["タイトル案1", "タイトル案2", "タイトル案3"],
@@ -84,7 +83,38 @@ SHORTS_SCORING_PROMPT = """
     "implementation": {{"score": <0-10>, "availability": "状況"}},
     "total_score": <合計点>,
     "one_line_hook": "<Shorts冒頭の一言（15字以内）>"
-}}
+}}"""
+
+# Shorts適性スコアリングプロンプト（単一論文）
+SHORTS_SCORING_PROMPT = f"""
+あなたはYouTube Shortsの編集者です。
+以下の論文が「30秒Shorts」として再生されやすいか評価してください。
+
+{SHORTS_SCORING_CRITERIA}
+
+## 論文情報
+タイトル: {{title}}
+アブストラクト: {{abstract}}
+
+## 出力形式（JSON）
+{SHORTS_RESULT_SCHEMA}
+"""
+
+# Shorts適性スコアリングプロンプト（バッチ: 複数論文を1リクエストで採点）
+SHORTS_BATCH_SCORING_PROMPT = f"""
+あなたはYouTube Shortsの編集者です。
+以下の複数の論文それぞれが「30秒Shorts」として再生されやすいか評価してください。
+
+{SHORTS_SCORING_CRITERIA}
+
+## 論文リスト
+{{papers_block}}
+## 出力形式（JSONの配列）
+論文リストと同じ順序で、各論文につき以下のスキーマのオブジェクトを1つ持つJSON配列のみを出力してください。
+[
+{SHORTS_RESULT_SCHEMA},
+...
+]
 """
 
 
@@ -109,100 +139,369 @@ def judge_verdict(total_score: int) -> str:
 class ShortsScorer:
     """YouTube Shorts適性スコアリング"""
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        use_cache: bool = True
+    ):
         """
         Args:
             api_key: Gemini APIキー
             model: 使用モデル名
+            use_cache: スコアリング結果のディスクキャッシュを使うか
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        gemini_client.configure(api_key)
+        # JSONモード指定によりレスポンス全体が必ずJSONになる
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.model = gemini_client.get_model(model, json_output=True)
+        self.cache = ResultCache("shorts_scores", enabled=use_cache)
         self.logger = logging.getLogger(self.__class__.__name__)
-    
-    def score_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+
+    def _build_prompt(self, paper: Dict[str, Any]) -> str:
+        """スコアリングプロンプトを構築"""
+        return SHORTS_SCORING_PROMPT.format(
+            title=paper.get("title", ""),
+            # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+            abstract=gemini_client.truncate_to_tokens(
+                paper.get("abstract", ""), max_tokens=750
+            )
+        )
+
+    def _parse_response(
+        self,
+        result_text: str,
+        paper: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Geminiレスポンスからスコアリング結果を抽出"""
+        try:
+            # JSONモードのためレスポンス全体をそのままパース
+            result = orjson.loads(result_text)
+        except orjson.JSONDecodeError:
+            # フォールバック: 括弧範囲を抽出（JSONモード以前の挙動）
+            start = result_text.find("{")
+            end = result_text.rfind("}") + 1
+            if start == -1 or end <= start:
+                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
+                return {"paper_id": paper.get("id"), "error": "Invalid format", "verdict": "SKIP"}
+            result = orjson.loads(result_text[start:end])
+        result["paper_id"] = paper.get("id")
+
+        # verdict判定（Python側で実施）
+        result["verdict"] = judge_verdict(result.get("total_score", 0))
+        return result
+
+    def _build_batch_prompt(self, papers: List[Dict[str, Any]]) -> str:
+        """バッチ採点プロンプトを構築（複数論文を1プロンプトに連結）"""
+        blocks = []
+        for i, paper in enumerate(papers, 1):
+            blocks.append(
+                f"### 論文{i}\n"
+                f"タイトル: {paper.get('title', '')}\n"
+                "アブストラクト: "
+                f"{gemini_client.truncate_to_tokens(paper.get('abstract', ''), max_tokens=750)}\n"
+            )
+        return SHORTS_BATCH_SCORING_PROMPT.format(papers_block="\n".join(blocks))
+
+    def _parse_batch_response(
+        self,
+        result_text: str,
+        papers: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """バッチレスポンスのJSON配列をpapersと同順のスコアリストに変換
+
+        要素数不一致・型不正・JSONパース失敗時はNoneを返し、呼び出し側で
+        単一論文採点にフォールバックさせる。
+        """
+        try:
+            # JSONモードのためレスポンス全体をそのままパース
+            items = orjson.loads(result_text)
+        except orjson.JSONDecodeError:
+            # フォールバック: 配列範囲を抽出（JSONモード以前の挙動）
+            start = result_text.find("[")
+            end = result_text.rfind("]") + 1
+            if start == -1 or end <= start:
+                return None
+            try:
+                items = orjson.loads(result_text[start:end])
+            except orjson.JSONDecodeError:
+                return None
+
+        if not isinstance(items, list) or len(items) != len(papers):
+            return None
+
+        results = []
+        for paper, item in zip(papers, items):
+            if not isinstance(item, dict):
+                return None
+            item["paper_id"] = paper.get("id")
+            item["verdict"] = judge_verdict(item.get("total_score", 0))
+            results.append(item)
+        return results
+
+    def score_paper(
+        self,
+        paper: Dict[str, Any],
+        delay_seconds: float = 0.0
+    ) -> Dict[str, Any]:
         """
         単一論文をスコアリング
-        
+
         Args:
             paper: 論文メタデータ
-        
+            delay_seconds: API呼び出し後のQPS平滑化待機秒数
+                           （キャッシュヒット時は待機しない）
+
         Returns:
             スコアリング結果
         """
-        prompt = SHORTS_SCORING_PROMPT.format(
-            title=paper.get("title", ""),
-            abstract=paper.get("abstract", "")[:2500]
-        )
-        
+        prompt = self._build_prompt(paper)
+
+        # 再実行時は同一プロンプトの結果をディスクから返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
+            response = gemini_client.generate_with_retry(
+                self.model, prompt, usage_tag="shorts_score"
+            )
             result_text = response.text
-            
-            # JSON部分を抽出
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                result["paper_id"] = paper.get("id")
-                
-                # verdict判定（Python側で実施）
-                total_score = result.get("total_score", 0)
-                result["verdict"] = judge_verdict(total_score)
-                
-                return result
-            else:
-                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
-                return {"paper_id": paper.get("id"), "error": "Invalid format", "verdict": "SKIP"}
-                
+
+            # APIを実際に呼んだときだけ待機（キャッシュヒット時は上でreturn済み）
+            if delay_seconds > 0:
+                time.sleep(delay_seconds)
+
+            result = self._parse_response(result_text, paper)
         except Exception as e:
             self.logger.error(f"Scoring error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e), "verdict": "SKIP"}
-    
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def score_paper_async(
+        self,
+        paper: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        delay_seconds: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        単一論文をスコアリング（非同期版）
+
+        Args:
+            paper: 論文メタデータ
+            semaphore: 同時リクエスト数を制限するセマフォ
+            delay_seconds: レート制限用の待機秒数
+
+        Returns:
+            スコアリング結果
+        """
+        prompt = self._build_prompt(paper)
+
+        # キャッシュヒットならAPIにもセマフォにも触れず即座に返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            try:
+                response = await gemini_client.generate_with_retry_async(
+                    self.model, prompt, usage_tag="shorts_score"
+                )
+                result = self._parse_response(response.text, paper)
+            except Exception as e:
+                self.logger.error(f"Scoring error for {paper.get('id')}: {e}")
+                result = {"paper_id": paper.get("id"), "error": str(e), "verdict": "SKIP"}
+
+            # セマフォ保持中に待機してQPSを平滑化
+            await asyncio.sleep(delay_seconds)
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def score_papers_async(
+        self,
+        papers: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        delay_seconds: float = 1.0,
+        checkpoint_path=None
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文をスコアリング（並行実行）
+
+        Args:
+            papers: 論文メタデータのリスト
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+            checkpoint_path: 指定時、完了したスコアを1件ずつJSON Linesで
+                             追記する（クラッシュ時に途中結果を保全し、
+                             再実行で採点済み分をスキップできる）
+
+        Returns:
+            スコアリング結果のリスト（papersと同順）
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.logger.info(f"Shorts scoring {len(papers)}件 (並行数{max_concurrent})")
+
+        if checkpoint_path is None:
+            tasks = [
+                self.score_paper_async(paper, semaphore, delay_seconds)
+                for paper in papers
+            ]
+            return list(await asyncio.gather(*tasks))
+
+        # 1件完了するごとに追記。コルーチンは単一イベントループ上で
+        # 書き込みが直列化されるためロックは不要
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(checkpoint_path, "ab") as ckpt:
+
+            async def score_and_checkpoint(paper):
+                result = await self.score_paper_async(
+                    paper, semaphore, delay_seconds
+                )
+                ckpt.write(orjson.dumps(result) + b"\n")
+                ckpt.flush()
+                return result
+
+            tasks = [score_and_checkpoint(paper) for paper in papers]
+            return list(await asyncio.gather(*tasks))
+
     def score_papers(
         self,
         papers: List[Dict[str, Any]],
-        delay_seconds: float = 1.0
+        max_concurrent: int = 8,
+        delay_seconds: float = 1.0,
+        checkpoint_path=None
     ) -> List[Dict[str, Any]]:
         """
-        複数論文をスコアリング
-        
+        複数論文をスコアリング（同期ラッパー）
+
         Args:
             papers: 論文メタデータのリスト
-            delay_seconds: リクエスト間の待機秒数
-        
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+            checkpoint_path: JSON Linesチェックポイントの追記先（任意）
+
         Returns:
             スコアリング結果のリスト
         """
-        results = []
-        
-        for i, paper in enumerate(papers):
-            self.logger.info(f"Shorts scoring {i+1}/{len(papers)}: {paper.get('id')}")
-            result = self.score_paper(paper)
-            results.append(result)
-            
-            if i < len(papers) - 1:
-                time.sleep(delay_seconds)
-        
-        return results
-    
-    def filter_by_verdict(
+        return asyncio.run(
+            self.score_papers_async(
+                papers, max_concurrent, delay_seconds, checkpoint_path
+            )
+        )
+
+    def score_papers_batched(
         self,
+        papers: List[Dict[str, Any]],
+        batch_size: int = 10,
+        delay_seconds: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文をバッチ採点（K論文を1プロンプトに束ねてリクエスト数を約1/Kに）
+
+        LLM APIのレイテンシは出力トークンよりリクエスト固定費（TTFB）が
+        支配的なため、束ねるほど全体の壁時計時間とレート制限消費が減る。
+        バッチのパース失敗時はそのバッチだけ単一論文採点にフォールバックする。
+
+        Args:
+            papers: 論文メタデータのリスト
+            batch_size: 1リクエストに束ねる論文数
+            delay_seconds: リクエストごとの待機秒数
+
+        Returns:
+            スコアリング結果のリスト（papersと同順）
+        """
+        self.logger.info(
+            f"Shorts scoring {len(papers)}件 (バッチサイズ{batch_size})"
+        )
+
+        results_by_id = {}
+        for offset in range(0, len(papers), batch_size):
+            batch = papers[offset:offset + batch_size]
+
+            # キャッシュ済みの論文はバッチから除外する
+            # （キーは単一論文プロンプトに統一し、単一採点パスと共有する）
+            pending = []
+            cache_keys = {}
+            for paper in batch:
+                key = ResultCache.make_key(
+                    paper.get("id"), self._build_prompt(paper)
+                )
+                cache_keys[paper.get("id")] = key
+                cached = self.cache.get(key)
+                if cached is not None:
+                    results_by_id[paper.get("id")] = cached
+                else:
+                    pending.append(paper)
+
+            if not pending:
+                continue
+
+            parsed = None
+            try:
+                response = gemini_client.generate_with_retry(
+                    self.model,
+                    self._build_batch_prompt(pending),
+                    usage_tag="shorts_score"
+                )
+                if delay_seconds > 0:
+                    time.sleep(delay_seconds)
+                parsed = self._parse_batch_response(response.text, pending)
+            except Exception as e:
+                self.logger.error(f"Batch scoring error: {e}")
+
+            if parsed is None:
+                # バッチ失敗時の保険: このバッチだけ1論文ずつ採点し直す
+                # （キャッシュ書き込みはscore_paper側で行われる）
+                self.logger.warning(
+                    f"バッチ採点失敗: {len(pending)}件を単一論文採点にフォールバック"
+                )
+                for paper in pending:
+                    results_by_id[paper.get("id")] = self.score_paper(
+                        paper, delay_seconds=delay_seconds
+                    )
+                continue
+
+            for paper, result in zip(pending, parsed):
+                if "error" not in result:
+                    self.cache.set(cache_keys[paper.get("id")], result)
+                results_by_id[paper.get("id")] = result
+
+        return [results_by_id[p.get("id")] for p in papers]
+
+    @staticmethod
+    def filter_by_verdict(
         scores: List[Dict[str, Any]],
-        include_mid: bool = True
+        include_mid: bool = True,
+        sort: bool = False
     ) -> List[Dict[str, Any]]:
         """
         verdict判定で動画化対象のみ抽出
-        
+
+        純粋なフィルタ処理のためstaticmethod。APIクライアントを初期化せず
+        `ShortsScorer.filter_by_verdict(...)` とクラスから直接呼べる。
+
         Args:
             scores: スコアリング結果のリスト
             include_mid: ADOPT_MIDも含めるか
-        
+            sort: total_score降順にソートして返すか
+                  （下流で候補リストを使い回すときに1回だけ指定する）
+
         Returns:
             ADOPT_HIGH + ADOPT_MID（オプション）のリスト
         """
-        if include_mid:
-            valid_verdicts = ("ADOPT_HIGH", "ADOPT_MID")
-        else:
-            valid_verdicts = ("ADOPT_HIGH",)
-        
-        return [s for s in scores if s.get("verdict") in valid_verdicts]
+        valid_verdicts = ADOPT_VERDICTS if include_mid else ADOPT_HIGH_ONLY
+
+        candidates = [s for s in scores if s.get("verdict") in valid_verdicts]
+        if sort:
+            candidates.sort(key=lambda s: s.get("total_score", 0), reverse=True)
+        return candidates
@@ -8,20 +8,33 @@ Features:
 """
 
 import os
-import json
-import csv
+import orjson
 import time
 import logging
+import shutil
+import struct
 import subprocess
 import tempfile
+import pandas as pd
 import requests
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-import google.generativeai as genai
-
 logger = logging.getLogger(__name__)
 
+# プロセス内MP3エンコーダ（オプション: 未導入ならffmpegで変換）
+try:
+    import lameenc
+    LAMEENC_AVAILABLE = True
+except ImportError:
+    LAMEENC_AVAILABLE = False
+
+# VOICEVOXのWAVは標準44バイトPCMヘッダ（fmt/dataチャンク固定長）
+WAV_HEADER_SIZE = 44
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # MoviePyレンダラー（オプション）
 try:
     from src.moviepy_renderer import MoviePyRenderer
@@ -29,10 +42,14 @@ try:
 except ImportError:
     MOVIEPY_AVAILABLE = False
 
-# Canva用テキスト生成プロンプト
-CANVA_TEXT_PROMPT = """
+from src import gemini_client
+from src.result_cache import ResultCache
+from src.shorts_scorer import ADOPT_VERDICTS
+
+# Canva用テキスト生成指示（静的部分・システムインストラクション）
+CANVA_SYSTEM_INSTRUCTION = """
 あなたはYouTube Shorts動画のコピーライターです。
-以下の論文情報から、20秒動画用の4行テキストを生成してください。
+与えられた論文情報から、20秒動画用の4行テキストを生成してください。
 
 ## 制約（厳守）
 - 日本語のみ
@@ -40,6 +57,7 @@ CANVA_TEXT_PROMPT = """
 - 絵文字は禁止
 - 改行禁止（各項目は1行で完結）
 - 煽りすぎて事実と矛盾しないこと
+- audio_scriptは出力しないこと（4項目からPython側で決定的に生成する）
 
 ## 生成内容
 
@@ -59,21 +77,51 @@ CANVA_TEXT_PROMPT = """
 - 不安・余韻・断定（CTA禁止）
 - 例: 「もう戻れない」「止まらない」
 
-## 論文情報
-タイトル: {title}
-アブストラクト: {abstract}
-煽りタイトル案: {best_title}
-Shortsスコア: {shorts_score}
-
 ## 出力形式（JSON）
-{{
+{
     "hook": "<12〜14文字>",
     "line1": "<18〜22文字>",
     "line2": "<25〜30文字>",
     "ending": "<8〜10文字>"
-}}
+}
 """
 
+# 採用候補1件分の処理計画。indexは出力ファイル名（video_XX）用の1始まり連番
+CandidatePlan = namedtuple("CandidatePlan", ["index", "paper", "score"])
+
+
+def build_candidate_plan(
+    papers: List[Dict[str, Any]],
+    shorts_scores: List[Dict[str, Any]]
+) -> List[CandidatePlan]:
+    """
+    採用候補の抽出・スコア順ソート・論文突き合わせを1パスで行う
+
+    verdictがADOPT_HIGH/ADOPT_MIDのスコアをtotal_score降順に並べ、
+    対応する論文メタデータと組にして返す。メタデータが見つからない
+    スコアは計画から除外される。
+
+    Args:
+        papers: 論文メタデータのリスト
+        shorts_scores: Shortsスコアのリスト
+
+    Returns:
+        CandidatePlanのリスト（スコア降順・連番付き）
+    """
+    paper_map = {p.get("id"): p for p in papers}
+    adopted = sorted(
+        (s for s in shorts_scores if s.get("verdict") in ADOPT_VERDICTS),
+        key=lambda s: s.get("total_score", 0),
+        reverse=True
+    )
+
+    plan = []
+    for score in adopted:
+        paper = paper_map.get(score.get("paper_id"))
+        if paper is not None:
+            plan.append(CandidatePlan(len(plan) + 1, paper, score))
+    return plan
+
 
 class ShortsVideoGenerator:
     """Canva CSV + VOICEVOX音声生成 統合クラス"""
@@ -83,7 +131,8 @@ class ShortsVideoGenerator:
         gemini_api_key: str,
         voicevox_url: str = "http://localhost:50021",
         speaker_id: int = 2,  # 四国めたん（ノーマル）
-        model: str = "gemini-2.5-flash"
+        model: str = "gemini-2.5-flash",
+        use_cache: bool = True
     ):
         """
         Args:
@@ -91,52 +140,110 @@ class ShortsVideoGenerator:
             voicevox_url: VOICEVOX Engine URL
             speaker_id: 話者ID（2=四国めたん ノーマル）
             model: Geminiモデル名
+            use_cache: Canvaテキストのディスクキャッシュを使うか
         """
-        genai.configure(api_key=gemini_api_key)
-        self.gemini_model = genai.GenerativeModel(model)
+        gemini_client.configure(gemini_api_key)
+        # 静的な指示はsystem_instructionに寄せ、リクエスト本文は論文情報のみ
+        # JSONモード指定によりレスポンス全体が必ずJSONになる
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.gemini_model = gemini_client.get_model(
+            model,
+            system_instruction=CANVA_SYSTEM_INSTRUCTION,
+            json_output=True
+        )
         self.voicevox_url = voicevox_url
         self.speaker_id = speaker_id
+        # VOICEVOXへはクリップごとに2リクエスト飛ぶため、
+        # keep-aliveプール付きセッションでTCP/HTTP握手を使い回す
+        self._http = requests.Session()
+        self._http.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        )
+        self.cache = ResultCache("canva_texts", enabled=use_cache)
+        self._renderer: Optional["MoviePyRenderer"] = None
         self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _get_renderer(self, output_dir: Path) -> "MoviePyRenderer":
+        """
+        MoviePyRendererを取得（呼び出しをまたいで再利用）
+
+        レンダラーはグラデーション背景・テキストラスタライズ・音声長の
+        キャッシュを持つため、process_papersのたびに作り直さない。
+        """
+        if self._renderer is None or self._renderer.output_dir != Path(output_dir):
+            self._renderer = MoviePyRenderer(
+                output_dir=output_dir,
+                resolution=(1080, 1920),
+                fps=30
+            )
+        return self._renderer
     
     def generate_canva_text(
         self,
         paper: Dict[str, Any],
-        shorts_score: Dict[str, Any]
+        shorts_score: Dict[str, Any],
+        delay_seconds: float = 0.0
     ) -> Dict[str, Any]:
-        """単一論文からCanvaテキスト生成"""
+        """単一論文からCanvaテキスト生成
+
+        delay_secondsはAPI呼び出し後のQPS平滑化待機秒数。
+        キャッシュヒット時は待機しない。
+        """
         clickbait = shorts_score.get("clickbait_potential", {})
         best_title = clickbait.get("best_title", "") if isinstance(clickbait, dict) else ""
-        
-        prompt = CANVA_TEXT_PROMPT.format(
-            title=paper.get("title", ""),
-            abstract=paper.get("abstract", "")[:1500],
-            best_title=best_title,
-            shorts_score=shorts_score.get("total_score", 0)
+
+        # 動的部分のみをf-stringで直組み（テンプレート再パースなし）
+        prompt = (
+            "## 論文情報\n"
+            f"タイトル: {paper.get('title', '')}\n"
+            "アブストラクト: "
+            # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+            f"{gemini_client.truncate_to_tokens(paper.get('abstract', ''), max_tokens=375)}\n"
+            f"煽りタイトル案: {best_title}\n"
+            f"Shortsスコア: {shorts_score.get('total_score', 0)}\n"
         )
-        
+
+        # 再実行時は同一プロンプトの結果をディスクから返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.gemini_model.generate_content(prompt)
+            response = gemini_client.generate_with_retry(
+                self.gemini_model, prompt, usage_tag="canva"
+            )
             result_text = response.text
-            
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                
-                # 改行を除去
-                for key in ["hook", "line1", "line2", "ending"]:
-                    if key in result:
-                        result[key] = result[key].replace("\n", "").replace("\r", "")
-                
-                result["paper_id"] = paper.get("id")
-                
-                # audio_script生成
-                result["audio_script"] = self._create_audio_script(result)
-                
-                return result
-            else:
-                return {"paper_id": paper.get("id"), "error": "Invalid format"}
-                
+
+            # APIを実際に呼んだときだけ待機（キャッシュヒット時は上でreturn済み）
+            if delay_seconds > 0:
+                time.sleep(delay_seconds)
+
+            try:
+                # JSONモードのためレスポンス全体をそのままパース
+                result = orjson.loads(result_text)
+            except orjson.JSONDecodeError:
+                # フォールバック: 括弧範囲を抽出（JSONモード以前の挙動）
+                start = result_text.find("{")
+                end = result_text.rfind("}") + 1
+                if start == -1 or end <= start:
+                    return {"paper_id": paper.get("id"), "error": "Invalid format"}
+                result = orjson.loads(result_text[start:end])
+
+            # 改行を除去
+            for key in ["hook", "line1", "line2", "ending"]:
+                if key in result:
+                    result[key] = result[key].replace("\n", "").replace("\r", "")
+
+            result["paper_id"] = paper.get("id")
+
+            # audio_script生成
+            result["audio_script"] = self._create_audio_script(result)
+
+            self.cache.set(cache_key, result)
+            return result
+
         except Exception as e:
             self.logger.error(f"Text generation error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e)}
@@ -151,6 +258,55 @@ class ShortsVideoGenerator:
                 parts.append(text + "。")
         return "".join(parts)
     
+    def _audio_query(
+        self,
+        text: str,
+        speed_scale: float,
+        intonation_scale: float
+    ) -> Dict[str, Any]:
+        """VOICEVOXのaudio_queryを取得（フェーズ1）"""
+        query_response = self._http.post(
+            f"{self.voicevox_url}/audio_query",
+            params={"text": text, "speaker": self.speaker_id},
+            timeout=30
+        )
+        query_response.raise_for_status()
+        query = query_response.json()
+
+        # 話速・抑揚設定
+        query["speedScale"] = speed_scale
+        query["intonationScale"] = intonation_scale
+        return query
+
+    def _synthesize(self, query: Dict[str, Any], output_path: Path) -> None:
+        """
+        VOICEVOXのsynthesis実行とmp3保存（フェーズ2）
+
+        lameenc導入時はレスポンスをストリーミング受信し、WAV全体を
+        メモリに確保せずチャンク単位でそのままMP3化する。
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if LAMEENC_AVAILABLE:
+            with self._http.post(
+                f"{self.voicevox_url}/synthesis",
+                params={"speaker": self.speaker_id},
+                json=query,
+                timeout=60,
+                stream=True
+            ) as synthesis_response:
+                synthesis_response.raise_for_status()
+                self._encode_mp3_streaming(synthesis_response, output_path)
+        else:
+            synthesis_response = self._http.post(
+                f"{self.voicevox_url}/synthesis",
+                params={"speaker": self.speaker_id},
+                json=query,
+                timeout=60
+            )
+            synthesis_response.raise_for_status()
+            self._encode_mp3_ffmpeg(synthesis_response.content, output_path)
+
     def generate_audio(
         self,
         text: str,
@@ -160,63 +316,88 @@ class ShortsVideoGenerator:
     ) -> bool:
         """VOICEVOX Engineで音声生成（mp3形式）"""
         try:
-            # 1. audio_query取得
-            query_response = requests.post(
-                f"{self.voicevox_url}/audio_query",
-                params={"text": text, "speaker": self.speaker_id},
-                timeout=30
-            )
-            query_response.raise_for_status()
-            query = query_response.json()
-            
-            # 話速・抑揚設定
-            query["speedScale"] = speed_scale
-            query["intonationScale"] = intonation_scale
-            
-            # 2. synthesis（音声生成）
-            synthesis_response = requests.post(
-                f"{self.voicevox_url}/synthesis",
-                params={"speaker": self.speaker_id},
-                json=query,
-                timeout=60
-            )
-            synthesis_response.raise_for_status()
-            
-            # 3. 一時ファイルにwav保存
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(synthesis_response.content)
-                tmp_wav_path = tmp.name
-            
-            # 4. ffmpegでmp3変換
-            import shutil
-            ffmpeg_path = shutil.which("ffmpeg")
-            if not ffmpeg_path:
-                # WinGetのデフォルトインストールパス
-                winget_ffmpeg = Path(os.path.expanduser(
-                    "~/AppData/Local/Microsoft/WinGet/Packages/Gyan.FFmpeg_Microsoft.Winget.Source_8wekyb3d8bbwe/ffmpeg-8.0.1-full_build/bin/ffmpeg.exe"
-                ))
-                if winget_ffmpeg.exists():
-                    ffmpeg_path = str(winget_ffmpeg)
-                else:
-                    raise FileNotFoundError("ffmpeg not found in PATH or WinGet location")
-            
-            try:
-                subprocess.run(
-                    [ffmpeg_path, "-y", "-i", tmp_wav_path, "-codec:a", "libmp3lame", "-qscale:a", "2", str(output_path)],
-                    capture_output=True,
-                    check=True
-                )
-            finally:
-                # 一時ファイル削除
-                if os.path.exists(tmp_wav_path):
-                    os.remove(tmp_wav_path)
-            
+            query = self._audio_query(text, speed_scale, intonation_scale)
+            self._synthesize(query, output_path)
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Audio generation error: {e}")
             return False
+
+    def _encode_mp3_streaming(self, response, output_path: Path) -> None:
+        """
+        synthesisレスポンスを受信しながらプロセス内でMP3化
+
+        WAVを丸ごとメモリに確保してから読み直す2重バッファを避け、
+        先頭44バイトのヘッダからサンプルレート・チャンネル数だけ
+        取り出し、後続のPCMを64KBチャンク単位で逐次エンコードする。
+
+        iter_contentのチャンク長は転送境界次第で任意（奇数もあり得る）
+        なのに対し、lameencは入力をint16のインターリーブPCMとして
+        解釈する。フレーム（2バイト×チャンネル数）の途中でチャンクを
+        渡すと以降の全サンプルがバイトずれを起こすため、端数は
+        持ち越して次チャンクの先頭に連結する。
+        """
+        encoder = None
+        frame_size = 2  # エンコーダ初期化後に 2 * channels で確定
+        carry = b""
+
+        with open(output_path, "wb") as mp3_file:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if encoder is None:
+                    # ヘッダが揃うまでバッファし、揃い次第エンコーダを初期化
+                    carry += chunk
+                    if len(carry) < WAV_HEADER_SIZE:
+                        continue
+                    channels, sample_rate = struct.unpack_from("<HI", carry, 22)
+                    encoder = lameenc.Encoder()
+                    encoder.set_bit_rate(128)
+                    encoder.set_in_sample_rate(sample_rate)
+                    encoder.set_channels(channels)
+                    encoder.set_quality(2)
+                    frame_size = 2 * channels
+                    chunk = carry[WAV_HEADER_SIZE:]
+                    carry = b""
+
+                carry += chunk
+                # フレーム境界で切り詰め、端数は次チャンクへ持ち越す
+                usable = len(carry) - (len(carry) % frame_size)
+                if usable:
+                    mp3_file.write(bytes(encoder.encode(carry[:usable])))
+                    carry = carry[usable:]
+
+            if encoder is not None:
+                # 末尾の端数は不完全フレームなので捨てる（通常は発生しない）
+                mp3_file.write(bytes(encoder.flush()))
+
+    def _encode_mp3_ffmpeg(self, wav_bytes: bytes, output_path: Path) -> None:
+        """ffmpegでMP3化（lameenc未導入時のフォールバック）"""
+        # 一時ファイルにwav保存
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            tmp.write(wav_bytes)
+            tmp_wav_path = tmp.name
+
+        ffmpeg_path = shutil.which("ffmpeg")
+        if not ffmpeg_path:
+            # WinGetのデフォルトインストールパス
+            winget_ffmpeg = Path(os.path.expanduser(
+                "~/AppData/Local/Microsoft/WinGet/Packages/Gyan.FFmpeg_Microsoft.Winget.Source_8wekyb3d8bbwe/ffmpeg-8.0.1-full_build/bin/ffmpeg.exe"
+            ))
+            if winget_ffmpeg.exists():
+                ffmpeg_path = str(winget_ffmpeg)
+            else:
+                raise FileNotFoundError("ffmpeg not found in PATH or WinGet location")
+
+        try:
+            subprocess.run(
+                [ffmpeg_path, "-y", "-i", tmp_wav_path, "-codec:a", "libmp3lame", "-qscale:a", "2", str(output_path)],
+                capture_output=True,
+                check=True
+            )
+        finally:
+            # 一時ファイル削除
+            if os.path.exists(tmp_wav_path):
+                os.remove(tmp_wav_path)
     
     def process_papers(
         self,
@@ -225,11 +406,13 @@ class ShortsVideoGenerator:
         output_dir: Path,
         date_str: str,
         delay_seconds: float = 0.5,
-        enable_moviepy: bool = True
+        enable_moviepy: bool = True,
+        render_workers: int = 1,
+        audio_workers: int = 4
     ) -> Dict[str, Any]:
         """
         論文からCSV + 音声ファイル + 動画を生成
-        
+
         Args:
             papers: 論文メタデータのリスト
             shorts_scores: Shortsスコアのリスト
@@ -237,103 +420,141 @@ class ShortsVideoGenerator:
             date_str: 日付文字列（YYYYMMDD）
             delay_seconds: リクエスト間の待機秒数
             enable_moviepy: MoviePyで動画生成するか（デフォルト: True）
-        
+            render_workers: 動画レンダリングの並列プロセス数（1で逐次）
+            audio_workers: 音声合成の並列数（VOICEVOXのワーカー数に合わせる）
+
         Returns:
             処理結果サマリー
         """
-        # ADOPT候補のみ抽出（スコア順）
-        score_map = {s.get("paper_id"): s for s in shorts_scores}
-        candidates = [s for s in shorts_scores if s.get("verdict") in ("ADOPT_HIGH", "ADOPT_MID")]
-        candidates_sorted = sorted(candidates, key=lambda x: x.get("total_score", 0), reverse=True)
-        
-        paper_map = {p.get("id"): p for p in papers}
-        
+        # 採用候補の抽出・ソート・論文突き合わせを1パスにまとめる
+        plan = build_candidate_plan(papers, shorts_scores)
+
         results = []
         audio_results = []
-        
-        for i, candidate in enumerate(candidates_sorted):
-            paper_id = candidate.get("paper_id")
-            paper = paper_map.get(paper_id)
-            if not paper:
-                continue
-            
-            self.logger.info(f"Processing {i+1}/{len(candidates_sorted)}: {paper_id}")
-            
-            # 1. Canvaテキスト生成
-            canva_text = self.generate_canva_text(paper, candidate)
-            results.append(canva_text)
-            
-            # 2. 音声生成
-            if "error" not in canva_text:
-                audio_path = output_dir / "audio" / f"video_{i+1:02d}.mp3"
-                success = self.generate_audio(
-                    canva_text.get("audio_script", ""),
-                    audio_path,
-                    speed_scale=0.9,
-                    intonation_scale=0.2
+        video_results = []
+        video_jobs = []  # render_workers > 1 のとき一括レンダリングに回す
+
+        renderer = None
+        if enable_moviepy and MOVIEPY_AVAILABLE:
+            renderer = self._get_renderer(output_dir)
+
+        # 音声合成はVOICEVOXへのHTTP待ちが支配的なので、ワーカースレッドに
+        # 投げてテキスト生成（Gemini待ち）と重ねる。完了した音声から順に
+        # 動画レンダリングへ流し、3工程の待ち時間を相互に吸収する。
+        # プール幅をVOICEVOX側のワーカー数に合わせれば、別クリップの
+        # audio_queryとsynthesisが同時に流れてエンジンを遊ばせない
+        with ThreadPoolExecutor(max_workers=audio_workers) as executor:
+            audio_futures = {}
+
+            for pos, item in enumerate(plan):
+                self.logger.info(
+                    f"Processing {item.index}/{len(plan)}: {item.score.get('paper_id')}"
                 )
+
+                # 1. Canvaテキスト生成（待機はメソッド内・キャッシュヒット時はスキップ）
+                canva_text = self.generate_canva_text(
+                    item.paper,
+                    item.score,
+                    delay_seconds if pos < len(plan) - 1 else 0.0
+                )
+                results.append(canva_text)
+
+                # 2. 音声生成を投入（完了を待たず次のテキストへ進む）
+                if "error" not in canva_text:
+                    audio_path = output_dir / "audio" / f"video_{item.index:02d}.mp3"
+                    future = executor.submit(
+                        self.generate_audio,
+                        canva_text.get("audio_script", ""),
+                        audio_path,
+                        0.9,   # speed_scale
+                        0.2    # intonation_scale
+                    )
+                    audio_futures[future] = {
+                        "index": item.index,
+                        "paper_id": item.score.get("paper_id"),
+                        "path": audio_path,
+                        "canva_text": canva_text
+                    }
+
+            # 3. 完了した音声から順に動画レンダリング（残りの合成と並行）
+            for future in as_completed(audio_futures):
+                meta = audio_futures[future]
+                idx = meta["index"]
+                try:
+                    success = bool(future.result())
+                except Exception as e:
+                    self.logger.error(f"Audio worker error (video {idx}): {e}")
+                    success = False
+
                 audio_results.append({
-                    "index": i+1,
-                    "paper_id": paper_id,
-                    "path": str(audio_path) if success else None,
+                    "index": idx,
+                    "paper_id": meta["paper_id"],
+                    "path": str(meta["path"]) if success else None,
                     "success": success
                 })
-            
-            if i < len(candidates_sorted) - 1:
-                time.sleep(delay_seconds)
-        
-        # CSV保存
-        csv_path = output_dir / f"shorts_video_{date_str}.csv"
-        self._save_csv(results, csv_path)
-        
-        # JSON保存
-        json_path = output_dir / f"shorts_video_{date_str}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
-        
-        # MoviePy動画生成
-        video_results = []
-        if enable_moviepy and MOVIEPY_AVAILABLE:
-            self.logger.info("Starting MoviePy video rendering...")
-            renderer = MoviePyRenderer(
-                output_dir=output_dir,
-                resolution=(1080, 1920),
-                fps=30
-            )
-            
-            for item in audio_results:
-                if not item.get("success"):
-                    continue
-                
-                idx = item["index"]
-                # 対応するテキストデータを取得
-                canva_text = results[idx - 1] if idx <= len(results) else {}
-                
-                if "error" in canva_text:
+
+                if not (success and renderer):
                     continue
-                
+
+                canva_text = meta["canva_text"]
                 texts = {
                     "hook": canva_text.get("hook", ""),
                     "line1": canva_text.get("line1", ""),
                     "line2": canva_text.get("line2", ""),
                     "ending": canva_text.get("ending", "")
                 }
-                
-                audio_path = Path(item["path"])
+
+                # 並列レンダリング時は全音声完了後にプロセスプールへ一括投入
+                if render_workers > 1:
+                    video_jobs.append({"index": idx, "texts": texts})
+                    continue
+
                 video_path = output_dir / "video" / f"video_{idx:02d}.mp4"
-                
                 result_path = renderer.render_video(
                     texts=texts,
-                    audio_path=audio_path,
+                    audio_path=meta["path"],
                     output_path=video_path
                 )
-                
+
                 video_results.append({
                     "index": idx,
                     "path": str(result_path) if result_path else None,
                     "success": result_path is not None
                 })
-        
+
+        # 動画単位の並列レンダリング（x264エンコードがCPUバウンドのため
+        # コア数に応じてプロセスでスケールさせる）
+        if renderer and video_jobs:
+            self.logger.info(
+                f"Starting MoviePy batch rendering ({render_workers} workers)..."
+            )
+            batch = renderer.render_batch(
+                video_jobs,
+                audio_dir=output_dir / "audio",
+                max_workers=min(render_workers, len(video_jobs))
+            )
+            rendered = {Path(p).stem: p for p in batch["paths"]}
+            for job in video_jobs:
+                path = rendered.get(f"video_{job['index']:02d}")
+                video_results.append({
+                    "index": job["index"],
+                    "path": path,
+                    "success": path is not None
+                })
+
+        audio_results.sort(key=lambda a: a["index"])
+        video_results.sort(key=lambda v: v["index"])
+
+        # CSV保存
+        csv_path = output_dir / f"shorts_video_{date_str}.csv"
+        self._save_csv(results, csv_path)
+
+        # JSON保存（orjson: C実装エンコーダ・バイト列を直接書き込み）
+        json_path = output_dir / f"shorts_video_{date_str}.json"
+        json_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+
         return {
             "total_processed": len(results),
             "audio_generated": sum(1 for a in audio_results if a.get("success")),
@@ -346,17 +567,15 @@ class ShortsVideoGenerator:
     def _save_csv(self, results: List[Dict[str, Any]], output_path: Path) -> None:
         """CSV保存（Canva Bulk Create用）"""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         valid_results = [r for r in results if "error" not in r]
-        
-        with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["hook", "line1", "line2", "ending", "audio_script"],
-                extrasaction="ignore"
-            )
-            writer.writeheader()
-            for row in valid_results:
-                writer.writerow(row)
-        
+
+        # 行ごとのDictWriterではなくC実装で一括書き出し
+        # （utf-8-sig: Excel対応BOM付き）
+        df = pd.DataFrame(
+            valid_results,
+            columns=["hook", "line1", "line2", "ending", "audio_script"]
+        )
+        df.to_csv(output_path, index=False, encoding="utf-8-sig")
+
         self.logger.info(f"CSV保存: {output_path} ({len(valid_results)}件)")
@@ -7,18 +7,20 @@ Features:
 - ハッシュタグ生成
 """
 
-import google.generativeai as genai
 from typing import List, Dict, Any
-import json
+import asyncio
+import orjson
 import logging
-import time
+
+from src import gemini_client
+from src.result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
-# Shorts台本生成プロンプト
-SHORTS_SCRIPT_PROMPT = """
+# 台本生成指示（静的部分・システムインストラクション）
+SHORTS_SCRIPT_SYSTEM_INSTRUCTION = """
 あなたはYouTube Shortsの人気クリエイターです。
-以下の論文を30秒のShorts台本に変換してください。
+与えられた論文を30秒のShorts台本に変換してください。
 
 ## 構成ルール（6ブロック・各5秒）
 
@@ -46,43 +48,99 @@ SHORTS_SCRIPT_PROMPT = """
 - 断定や不安を残す一言（フォロー誘導はしない）
 - 例: 「これ、もう止まらない」「気づいた時には遅いかも」
 
-## 論文情報
-タイトル: {title}
-アブストラクト: {abstract}
-Shortsスコア: {shorts_score}点
-煽りタイトル: {best_title}
-
 ## 出力形式（JSON）
-{{
+{
     "video_title": "<YouTube動画タイトル（40字以内）>",
     "thumbnail_text": "<サムネイル用テキスト（10字以内）>",
     "blocks": [
-        {{"block": 1, "type": "フック", "script": "台本", "visual_note": "映像メモ"}},
-        {{"block": 2, "type": "問題提起", "script": "台本", "visual_note": "映像メモ"}},
-        {{"block": 3, "type": "解決策", "script": "台本", "visual_note": "映像メモ"}},
-        {{"block": 4, "type": "証拠", "script": "台本", "visual_note": "映像メモ"}},
-        {{"block": 5, "type": "影響", "script": "台本", "visual_note": "映像メモ"}},
-        {{"block": 6, "type": "余韻", "script": "台本", "visual_note": "映像メモ"}}
+        {"block": 1, "type": "フック", "script": "台本", "visual_note": "映像メモ"},
+        {"block": 2, "type": "問題提起", "script": "台本", "visual_note": "映像メモ"},
+        {"block": 3, "type": "解決策", "script": "台本", "visual_note": "映像メモ"},
+        {"block": 4, "type": "証拠", "script": "台本", "visual_note": "映像メモ"},
+        {"block": 5, "type": "影響", "script": "台本", "visual_note": "映像メモ"},
+        {"block": 6, "type": "余韻", "script": "台本", "visual_note": "映像メモ"}
     ],
     "full_script": "<全文ナレーション>",
     "hashtags": ["#AI", "#論文解説", "#テック"]
-}}
+}
 """
 
 
 class ShortsWriter:
     """YouTube Shorts 30秒台本生成"""
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        use_cache: bool = True
+    ):
         """
         Args:
             api_key: Gemini APIキー
             model: 使用モデル名
+            use_cache: 台本のディスクキャッシュを使うか
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        gemini_client.configure(api_key)
+        # 静的な指示はsystem_instructionに寄せ、リクエスト本文は論文情報のみ
+        # JSONモード指定によりレスポンス全体が必ずJSONになる
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.model = gemini_client.get_model(
+            model,
+            system_instruction=SHORTS_SCRIPT_SYSTEM_INSTRUCTION,
+            json_output=True
+        )
+        self.cache = ResultCache("scripts", enabled=use_cache)
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def _build_prompt(
+        self,
+        paper: Dict[str, Any],
+        shorts_score: Dict[str, Any],
+        best_title: str
+    ) -> str:
+        """台本生成プロンプトを構築（動的部分のみ・f-string直組み）"""
+        return (
+            "## 論文情報\n"
+            f"タイトル: {paper.get('title', '')}\n"
+            "アブストラクト: "
+            # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+            f"{gemini_client.truncate_to_tokens(paper.get('abstract', ''), max_tokens=500)}\n"
+            f"Shortsスコア: {shorts_score.get('total_score', 0)}点\n"
+            f"煽りタイトル: {best_title}\n"
+        )
+
+    def _parse_response(
+        self,
+        result_text: str,
+        paper: Dict[str, Any],
+        shorts_score: Dict[str, Any],
+        best_title: str
+    ) -> Dict[str, Any]:
+        """Geminiレスポンスから台本データを抽出"""
+        try:
+            # JSONモードのためレスポンス全体をそのままパース
+            result = orjson.loads(result_text)
+        except orjson.JSONDecodeError:
+            # フォールバック: 括弧範囲を抽出（JSONモード以前の挙動）
+            start = result_text.find("{")
+            end = result_text.rfind("}") + 1
+            if start == -1 or end <= start:
+                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
+                return {"paper_id": paper.get("id"), "error": "Invalid format"}
+            result = orjson.loads(result_text[start:end])
+        result["paper_id"] = paper.get("id")
+        result["shorts_score"] = shorts_score.get("total_score", 0)
+        result["verdict"] = shorts_score.get("verdict", "")
+        result["best_title"] = best_title
+        return result
+
+    @staticmethod
+    def _best_title(paper: Dict[str, Any], shorts_score: Dict[str, Any]) -> str:
+        """clickbait_potentialから煽りタイトルを取得"""
+        clickbait = shorts_score.get("clickbait_potential", {})
+        return clickbait.get("best_title", paper.get("title", ""))
+
     def generate_script(
         self,
         paper: Dict[str, Any],
@@ -90,78 +148,148 @@ class ShortsWriter:
     ) -> Dict[str, Any]:
         """
         単一論文から台本生成
-        
+
         Args:
             paper: 論文メタデータ
             shorts_score: Shortsスコアリング結果
-        
+
         Returns:
             台本データ
         """
-        # best_titleを取得（clickbait_potentialから）
-        clickbait = shorts_score.get("clickbait_potential", {})
-        best_title = clickbait.get("best_title", paper.get("title", ""))
-        
-        prompt = SHORTS_SCRIPT_PROMPT.format(
-            title=paper.get("title", ""),
-            abstract=paper.get("abstract", "")[:2000],
-            shorts_score=shorts_score.get("total_score", 0),
-            best_title=best_title
-        )
-        
+        best_title = self._best_title(paper, shorts_score)
+        prompt = self._build_prompt(paper, shorts_score, best_title)
+
+        # 再実行時は同一プロンプトの結果をディスクから返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text
-            
-            # JSON部分を抽出
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                result["paper_id"] = paper.get("id")
-                result["shorts_score"] = shorts_score.get("total_score", 0)
-                result["verdict"] = shorts_score.get("verdict", "")
-                result["best_title"] = best_title
-                return result
-            else:
-                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
-                return {"paper_id": paper.get("id"), "error": "Invalid format"}
-                
+            response = gemini_client.generate_with_retry(
+                self.model, prompt, usage_tag="script"
+            )
+            result = self._parse_response(
+                response.text, paper, shorts_score, best_title
+            )
         except Exception as e:
             self.logger.error(f"Script generation error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e)}
-    
-    def generate_scripts(
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def generate_script_async(
+        self,
+        paper: Dict[str, Any],
+        shorts_score: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        delay_seconds: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        単一論文から台本生成（非同期版）
+
+        Args:
+            paper: 論文メタデータ
+            shorts_score: Shortsスコアリング結果
+            semaphore: 同時リクエスト数を制限するセマフォ
+            delay_seconds: レート制限用の待機秒数
+
+        Returns:
+            台本データ
+        """
+        best_title = self._best_title(paper, shorts_score)
+        prompt = self._build_prompt(paper, shorts_score, best_title)
+
+        # キャッシュヒットならAPIにもセマフォにも触れず即座に返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            try:
+                response = await gemini_client.generate_with_retry_async(
+                    self.model, prompt, usage_tag="script"
+                )
+                result = self._parse_response(
+                    response.text, paper, shorts_score, best_title
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Script generation error for {paper.get('id')}: {e}"
+                )
+                result = {"paper_id": paper.get("id"), "error": str(e)}
+
+            # セマフォ保持中に待機してQPSを平滑化
+            await asyncio.sleep(delay_seconds)
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def generate_scripts_async(
         self,
         papers: List[Dict[str, Any]],
         shorts_scores: List[Dict[str, Any]],
+        max_concurrent: int = 8,
         delay_seconds: float = 1.0
     ) -> List[Dict[str, Any]]:
         """
-        複数論文から台本生成
-        
+        複数論文から台本生成（並行実行）
+
         Args:
             papers: 論文メタデータのリスト
             shorts_scores: Shortsスコアリング結果のリスト
-            delay_seconds: リクエスト間の待機秒数
-        
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
         Returns:
-            台本データのリスト
+            台本データのリスト（papersと同順）
         """
         # paper_id -> shorts_scoreのマッピング
         score_map = {s.get("paper_id"): s for s in shorts_scores}
-        
-        results = []
-        
-        for i, paper in enumerate(papers):
-            paper_id = paper.get("id")
-            shorts_score = score_map.get(paper_id, {})
-            
-            self.logger.info(f"Generating script {i+1}/{len(papers)}: {paper_id}")
-            result = self.generate_script(paper, shorts_score)
-            results.append(result)
-            
-            if i < len(papers) - 1:
-                time.sleep(delay_seconds)
-        
-        return results
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.logger.info(
+            f"Generating {len(papers)}件の台本 (並行数{max_concurrent})"
+        )
+
+        tasks = [
+            self.generate_script_async(
+                paper,
+                score_map.get(paper.get("id"), {}),
+                semaphore,
+                delay_seconds
+            )
+            for paper in papers
+        ]
+        return list(await asyncio.gather(*tasks))
+
+    def generate_scripts(
+        self,
+        papers: List[Dict[str, Any]],
+        shorts_scores: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        delay_seconds: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文から台本生成（同期ラッパー）
+
+        Args:
+            papers: 論文メタデータのリスト
+            shorts_scores: Shortsスコアリング結果のリスト
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
+        Returns:
+            台本データのリスト
+        """
+        return asyncio.run(
+            self.generate_scripts_async(
+                papers, shorts_scores, max_concurrent, delay_seconds
+            )
+        )
@@ -8,26 +8,24 @@ Features:
 - バッチAPI対応（50%オフ）
 """
 
-import google.generativeai as genai
 from typing import List, Dict, Any
-import json
+import asyncio
+import orjson
 import logging
 import time
 
+from src import gemini_client
+from src.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
-# 翻訳・要約用プロンプトテンプレート
-TRANSLATION_PROMPT = """
+# 翻訳・要約指示（静的部分・システムインストラクション）
+TRANSLATION_SYSTEM_INSTRUCTION = """
 あなたは学術論文の翻訳・要約エキスパートです。
-以下の論文のタイトルとアブストラクトを日本語に翻訳し、わかりやすく要約してください。
-
-## 論文情報
-タイトル: {title}
-カテゴリ: {categories}
-アブストラクト: {abstract}
+与えられた論文のタイトルとアブストラクトを日本語に翻訳し、わかりやすく要約してください。
 
 ## 出力形式（JSON）
-{{
+{
     "title_ja": "<タイトルの日本語訳>",
     "abstract_ja": "<アブストラクトの日本語訳（200字程度に要約）>",
     "summary_3lines": [
@@ -37,85 +35,204 @@ TRANSLATION_PROMPT = """
     ],
     "keywords": ["<キーワード1>", "<キーワード2>", "<キーワード3>"],
     "youtube_hook": "<YouTubeショート用の興味を引く一言（20字以内）>"
-}}
+}
 """
 
 
 class Translator:
     """論文翻訳クラス"""
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        use_cache: bool = True
+    ):
         """
         Args:
             api_key: Gemini APIキー
             model: 使用モデル名
+            use_cache: 翻訳結果のディスクキャッシュを使うか
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        gemini_client.configure(api_key)
+        # 静的な指示はsystem_instructionに寄せ、リクエスト本文は論文情報のみ
+        # JSONモード指定によりレスポンス全体が必ずJSONになる
+        # （同一設定のモデルインスタンスはプロセス内で共有される）
+        self.model = gemini_client.get_model(
+            model,
+            system_instruction=TRANSLATION_SYSTEM_INSTRUCTION,
+            json_output=True
+        )
+        self.cache = ResultCache("translated", enabled=use_cache)
         self.logger = logging.getLogger(self.__class__.__name__)
-    
-    def translate_paper(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+
+    def _build_prompt(self, paper: Dict[str, Any]) -> str:
+        """翻訳プロンプトを構築（動的部分のみ・f-string直組み）"""
+        return (
+            "## 論文情報\n"
+            f"タイトル: {paper.get('title', '')}\n"
+            f"カテゴリ: {', '.join(paper.get('categories', []))}\n"
+            "アブストラクト: "
+            # 文字数ではなくトークン予算で切り詰め（日本語混在対策）
+            f"{gemini_client.truncate_to_tokens(paper.get('abstract', ''), max_tokens=750)}\n"
+        )
+
+    def _parse_response(
+        self,
+        result_text: str,
+        paper: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Geminiレスポンスから翻訳結果を抽出"""
+        try:
+            # JSONモードのためレスポンス全体をそのままパース
+            result = orjson.loads(result_text)
+        except orjson.JSONDecodeError:
+            # フォールバック: 括弧範囲を抽出（JSONモード以前の挙動）
+            start = result_text.find("{")
+            end = result_text.rfind("}") + 1
+            if start == -1 or end <= start:
+                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
+                return {"paper_id": paper.get("id"), "error": "Invalid format"}
+            result = orjson.loads(result_text[start:end])
+
+        result["paper_id"] = paper.get("id")
+        result["original_title"] = paper.get("title")
+        return result
+
+    def translate_paper(
+        self,
+        paper: Dict[str, Any],
+        delay_seconds: float = 0.0
+    ) -> Dict[str, Any]:
         """
         単一論文を翻訳・要約
-        
+
         Args:
             paper: 論文メタデータ
-        
+            delay_seconds: API呼び出し後のQPS平滑化待機秒数
+                           （キャッシュヒット時は待機しない）
+
         Returns:
             翻訳結果
         """
-        prompt = TRANSLATION_PROMPT.format(
-            title=paper.get("title", ""),
-            categories=", ".join(paper.get("categories", [])),
-            abstract=paper.get("abstract", "")[:3000]
-        )
-        
+        prompt = self._build_prompt(paper)
+
+        # 再実行時は同一プロンプトの結果をディスクから返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
+            response = gemini_client.generate_with_retry(
+                self.model, prompt, usage_tag="translation"
+            )
             result_text = response.text
-            
-            # JSON部分を抽出
-            start = result_text.find("{")
-            end = result_text.rfind("}") + 1
-            if start != -1 and end > start:
-                result = json.loads(result_text[start:end])
-                result["paper_id"] = paper.get("id")
-                result["original_title"] = paper.get("title")
-                return result
-            else:
-                self.logger.warning(f"Invalid response format for: {paper.get('id')}")
-                return {"paper_id": paper.get("id"), "error": "Invalid format"}
-                
+
+            # APIを実際に呼んだときだけ待機（キャッシュヒット時は上でreturn済み）
+            if delay_seconds > 0:
+                time.sleep(delay_seconds)
+
+            result = self._parse_response(result_text, paper)
         except Exception as e:
             self.logger.error(f"Translation error for {paper.get('id')}: {e}")
             return {"paper_id": paper.get("id"), "error": str(e)}
-    
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def translate_paper_async(
+        self,
+        paper: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        delay_seconds: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        単一論文を翻訳・要約（非同期版）
+
+        Args:
+            paper: 論文メタデータ
+            semaphore: 同時リクエスト数を制限するセマフォ
+            delay_seconds: レート制限用の待機秒数
+
+        Returns:
+            翻訳結果
+        """
+        prompt = self._build_prompt(paper)
+
+        # キャッシュヒットならAPIにもセマフォにも触れず即座に返す
+        cache_key = ResultCache.make_key(paper.get("id"), prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            try:
+                response = await gemini_client.generate_with_retry_async(
+                    self.model, prompt, usage_tag="translation"
+                )
+                result = self._parse_response(response.text, paper)
+            except Exception as e:
+                self.logger.error(f"Translation error for {paper.get('id')}: {e}")
+                result = {"paper_id": paper.get("id"), "error": str(e)}
+
+            # セマフォ保持中に待機してQPSを平滑化
+            await asyncio.sleep(delay_seconds)
+
+        # エラー結果はキャッシュせず次回リトライさせる
+        if "error" not in result:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def translate_papers_async(
+        self,
+        papers: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        delay_seconds: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        複数論文を翻訳・要約（並行実行）
+
+        Args:
+            papers: 論文メタデータのリスト
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
+        Returns:
+            翻訳結果のリスト（papersと同順）
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        self.logger.info(f"Translating {len(papers)}件 (並行数{max_concurrent})")
+
+        tasks = [
+            self.translate_paper_async(paper, semaphore, delay_seconds)
+            for paper in papers
+        ]
+        return list(await asyncio.gather(*tasks))
+
     def translate_papers(
         self,
         papers: List[Dict[str, Any]],
+        max_concurrent: int = 8,
         delay_seconds: float = 1.0
     ) -> List[Dict[str, Any]]:
         """
-        複数論文を翻訳・要約
-        
+        複数論文を翻訳・要約（同期ラッパー）
+
         Args:
             papers: 論文メタデータのリスト
-            delay_seconds: リクエスト間の待機秒数
-        
+            max_concurrent: 最大同時リクエスト数
+            delay_seconds: リクエストごとの待機秒数
+
         Returns:
             翻訳結果のリスト
         """
-        results = []
-        
-        for i, paper in enumerate(papers):
-            self.logger.info(f"Translating {i+1}/{len(papers)}: {paper.get('id')}")
-            result = self.translate_paper(paper)
-            results.append(result)
-            
-            if i < len(papers) - 1:
-                time.sleep(delay_seconds)
-        
-        return results
+        return asyncio.run(
+            self.translate_papers_async(papers, max_concurrent, delay_seconds)
+        )
 
 
 if __name__ == "__main__":
@@ -140,4 +257,4 @@ if __name__ == "__main__":
     }
     
     result = translator.translate_paper(test_paper)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())